@@ -0,0 +1,23 @@
+import asyncio
+import threading
+
+# One event loop for the bot's network I/O, running in a daemon thread. Sync code hands it
+# coroutines; async clients created on it (httpx.AsyncClient, ...) keep their pools warm across ticks.
+_loop = None
+_loop_lock = threading.Lock()
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="async-io", daemon=True).start()
+    return _loop
+
+def submit(coro):
+    """Schedules `coro` on the shared loop. Returns a concurrent.futures.Future (non-blocking)."""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+def run_async(coro, timeout: float = None):
+    """Runs `coro` on the shared loop and blocks until it finishes. Exceptions propagate."""
+    return submit(coro).result(timeout)
@@ -229,8 +229,9 @@ class Backtester:
             # 2. Build indicators dict with ALL fields the Beast Mode strategies need
             indicators = {
                 "close": current_candle['close'],
-                "rsi": current_candle.get('RSI_14', 50),
-                "RSI_14": current_candle.get('RSI_14', 50),
+                # RSI column is float32 -> hand strategies a Python float
+                "rsi": float(current_candle.get('RSI_14', 50)),
+                "RSI_14": float(current_candle.get('RSI_14', 50)),
                 "ema_13": current_candle.get('EMA_13', 0),
                 "ema_50": current_candle.get('EMA_50', 0),
                 "EMA_50": current_candle.get('EMA_50', 0),
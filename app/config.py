@@ -18,6 +18,9 @@ class Config:
     # If BACKTEST_MODE is True, we don't send orders to MT5, just log them.
     BACKTEST_MODE = os.getenv("BACKTEST_MODE", "true").lower() == "true"
     
+    # Execution event log level (INFO shows every fill/SL move; WARNING keeps backtest sweeps quiet)
+    EXECUTION_LOG_LEVEL = os.getenv("EXECUTION_LOG_LEVEL", "INFO").upper()
+    
     # Cost Optimization - GOLD SPREADS
     SMART_FILTER = os.getenv("SMART_FILTER", "true").lower() == "true"
     MAX_OPEN_TRADES = 3 # Pyramiding Limit (Reduced to 3 as per User Request)
@@ -39,6 +42,14 @@ class Config:
     # Phase 90: SMC Filter
     ENABLE_SMC_FILTER = True # Enforces Institutional Order Block filters on signals
     
+    # Groq Model Routing
+    # Main decision model. Override for A/B runs (e.g. a speculative-decoding variant when one is served).
+    GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
+    # News-impact classification is a single-deviation call -> the 8b instant model is enough and ~3x faster.
+    FAST_NEWS_MODEL = os.getenv("FAST_NEWS_MODEL", "true").lower() == "true"
+    NEWS_MODEL = os.getenv("NEWS_MODEL", "llama-3.1-8b-instant")
+    GROQ_WARMUP = os.getenv("GROQ_WARMUP", "true").lower() == "true" # Open the TLS pool at boot, not on the first tick
+    
     # Credentials
     MT5_LOGIN = os.getenv("MT5_LOGIN")
     MT5_PASSWORD = os.getenv("MT5_PASSWORD")
@@ -1,10 +1,83 @@
 import json
 import os
+import mmap
+import logging
+from logging.handlers import MemoryHandler
+import numpy as np
 import MetaTrader5 as mt5
 from datetime import datetime
 from app.config import Config
+from app.jit import njit
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+MMAP_MIN_BYTES = 16 * 1024 # Below this, mmap setup costs more than a plain read
+
+# Buffered execution log: records are held in memory and written once per monitoring
+# tick or order (immediately on WARNING and above) instead of a blocking stdout flush per event.
+# Backtest sweeps can set EXECUTION_LOG_LEVEL=WARNING so routine events cost only a level check.
+logger = logging.getLogger("EXECUTION")
+logger.setLevel(Config.EXECUTION_LOG_LEVEL)
+logger.propagate = False
+if not logger.handlers:
+    _log_buffer = MemoryHandler(capacity=1000, flushLevel=logging.WARNING, target=logging.StreamHandler())
+    logger.addHandler(_log_buffer)
+
+def flush_execution_log():
+    """Writes out any buffered execution events."""
+    for handler in logger.handlers:
+        handler.flush()
+
+# Trailing-stop reason codes returned by _trail_kernel
+_TRAIL_NONE = 0
+_TRAIL_BREAK_EVEN = 1
+_TRAIL_FRACTAL = 2
+_TRAIL_REASONS = {_TRAIL_BREAK_EVEN: "Break-Even (+1R)", _TRAIL_FRACTAL: "Structure Trail (Fractal)"}
+
+@njit(cache=True)
+def _trail_kernel(sign, current_price, entry, current_sl, risk, ts_buffer, f_sup, f_res):
+    """
+    Pure-float trailing stop math (sign: +1.0 BUY / -1.0 SELL).
+    Returns (new_sl, reason_code, take_partial). Side effects stay in apply_trailing_stop.
+    """
+    new_sl = 0.0
+    reason = _TRAIL_NONE
+    profit = sign * (current_price - entry)
+    
+    # Trigger 1: Break Even (Profit > 1.0 * Risk) while SL is still on the losing side of entry
+    if profit > risk and sign * (entry - current_sl) > 0:
+        new_sl = entry + sign * ts_buffer
+        reason = _TRAIL_BREAK_EVEN
+    # Trigger 2: Fractal Trailing (Profit > 2.0 * Risk)
+    # BUY trails to the last support fractal, SELL to the last resistance fractal,
+    # only if it tightens the stop and sits between the stop and current price.
+    # Gated on a fractal being present first: most ticks carry none, so this costs one compare.
+    elif (f_sup if sign > 0 else f_res) > 0 and profit > 2.0 * risk:
+        level = f_sup if sign > 0 else f_res
+        if sign * (level - current_sl) > 0 and sign * (current_price - level) > 0:
+            new_sl = level - sign * ts_buffer # Buffer beyond the fractal
+            reason = _TRAIL_FRACTAL
+            
+    # Multi-Tier Partial Profiling (1.5R)
+    return new_sl, reason, profit > 1.5 * risk
 
 class ExecutionEngine:
+    # Constant parts of MT5 order requests; each call copies and fills in the varying fields
+    _DEAL_TEMPLATE = {
+        "action": mt5.TRADE_ACTION_DEAL,
+        "deviation": 20,
+        "magic": 123456,
+        "type_time": mt5.ORDER_TIME_GTC,
+        "type_filling": mt5.ORDER_FILLING_IOC,
+    }
+    _SLTP_TEMPLATE = {"action": mt5.TRADE_ACTION_SLTP, "tp": 0.0, "magic": 123456}
+    # Set when trades.json exists but can't be parsed or moved aside (see load_state)
+    _state_unreadable = False
+
     def __init__(self):
         self.trades_file = Config.TRADES_FILE
         self.symbol = Config.SYMBOL
@@ -14,20 +87,48 @@ class ExecutionEngine:
 
     def load_state(self) -> list:
         """Reads trades.json. Returns a LIST of active trades."""
-        if not os.path.exists(self.trades_file):
-            return []
+        # Single open() instead of exists()+open(): one syscall, no TOCTOU window
         try:
-            with open(self.trades_file, 'r') as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    # Migration: Convert legacy single trade to list
-                    return [data] if data else []
-                return data
-        except json.JSONDecodeError:
+            with open(self.trades_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if ORJSON_AVAILABLE and size >= MMAP_MIN_BYTES:
+                    # Large history: let orjson parse straight from the page cache
+                    # (orjson takes a memoryview, not the mmap object itself)
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            data = orjson.loads(view)
+                else:
+                    raw = f.read()
+                    if not raw.strip():
+                        return [] # Empty file (e.g. truncated by a reset) = no trades
+                    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        except FileNotFoundError:
+            return []
+        except ValueError as e:
+            # Unreadable state is NOT an empty book: keep the file out of save_state's way
+            # so the open trades in it can be recovered by hand
+            backup = self.trades_file + ".corrupt"
+            logger.error("Could not parse %s (%s). Moved it to %s; starting with no tracked trades.",
+                         self.trades_file, e, backup)
+            try:
+                os.replace(self.trades_file, backup)
+            except OSError as move_error:
+                # Still in place -> save_state must not write over it
+                self._state_unreadable = True
+                logger.error("Could not move unreadable trades file: %s", move_error)
+            flush_execution_log()
             return []
+        if isinstance(data, dict):
+            # Migration: Convert legacy single trade to list
+            return [data] if data else []
+        return data
 
     def save_state(self, trades: list):
         """Writes LIST of trades to trades.json."""
+        if self._state_unreadable:
+            logger.error("Refusing to overwrite unreadable %s; resolve it by hand.", self.trades_file)
+            flush_execution_log()
+            return
         with open(self.trades_file, 'w') as f:
             json.dump(trades, f, indent=4)
 
@@ -38,6 +139,11 @@ class ExecutionEngine:
 
     def execute_trade(self, action: str, sl_price: float, tp_price: float, risk_units: float, current_price: float) -> dict:
         """Executes a NEW trade and appends to the list."""
+        # A position we can't persist gets no trailing/partial/close handling -> don't open it
+        if self._state_unreadable:
+            logger.error("Trade blocked: %s is unreadable and could not be moved aside.", self.trades_file)
+            flush_execution_log()
+            return None
         
         # 1. Logic to calculate volume (same as before)
         contract_size = 1.0
@@ -50,7 +156,7 @@ class ExecutionEngine:
         volume_lots = risk_units / contract_size
         volume_lots = max(0.01, round(volume_lots, 2))
 
-        print(f"EXECUTING {action} | Volume: {volume_lots} Lots | SL: {sl_price} | TP: {tp_price}")
+        logger.info("EXECUTING %s | Volume: %s Lots | SL: %s | TP: %s", action, volume_lots, sl_price, tp_price)
 
         # BACKTEST MOCK
         if self.backtest_mode:
@@ -71,12 +177,13 @@ class ExecutionEngine:
             current_trades.append(trade_data)
             self.save_state(current_trades)
             
-            print(f"[BACKTEST] Trade Mock-Executed. Ticket: {mock_ticket}")
+            logger.info("[BACKTEST] Trade Mock-Executed. Ticket: %s", mock_ticket)
+            flush_execution_log() # Order events are written now, not at the next monitor tick
             return trade_data
 
         # LIVE MODE
         if not mt5.initialize():
-            print("MT5 Not Verified.")
+            logger.error("MT5 Not Verified.")
             return None
             
         # Get Price
@@ -84,27 +191,16 @@ class ExecutionEngine:
         price = tick.ask if action == "BUY" else tick.bid
         
         order_type = mt5.ORDER_TYPE_BUY if action == "BUY" else mt5.ORDER_TYPE_SELL
-        request = {
-            "action": mt5.TRADE_ACTION_DEAL,
-            "symbol": self.symbol,
-            "volume": volume_lots,
-            "type": order_type,
-            "price": price,
-            "sl": sl_price,
-            "tp": tp_price,
-            "deviation": 20,
-            "magic": 123456,
-            "comment": "Groq-Bot Pycn",
-            "type_time": mt5.ORDER_TIME_GTC,
-            "type_filling": mt5.ORDER_FILLING_IOC,
-        }
+        request = self._DEAL_TEMPLATE.copy()
+        request.update(symbol=self.symbol, volume=volume_lots, type=order_type, price=price,
+                       sl=sl_price, tp=tp_price, comment="Groq-Bot Pycn")
         
         result = mt5.order_send(request)
         if result.retcode != mt5.TRADE_RETCODE_DONE:
-            print(f"Order Send Failed: {result.retcode}")
+            logger.error("Order Send Failed: %s", result.retcode)
             return None
             
-        print(f"Order Sent! Ticket: {result.order}")
+        logger.info("Order Sent! Ticket: %s", result.order)
         
         trade_data = {
             "ticket": str(result.order),
@@ -121,41 +217,46 @@ class ExecutionEngine:
         current_trades = self.load_state()
         current_trades.append(trade_data)
         self.save_state(current_trades)
+        flush_execution_log() # Order events are written now, not at the next monitor tick
         return trade_data
 
-    def modify_order_sl(self, ticket: int, new_sl: float) -> bool:
+    def _get_position(self, ticket: int, positions: dict = None):
+        """Returns the MT5 position for ticket, preferring the per-tick snapshot over a fresh IPC call."""
+        if positions is not None:
+            return positions.get(ticket)
+        pos = mt5.positions_get(ticket=ticket)
+        return pos[0] if pos else None
+
+    def modify_order_sl(self, ticket: int, new_sl: float, positions: dict = None) -> bool:
         """Helper to modify SL."""
         if self.backtest_mode: return True
         
-        request = {"action": mt5.TRADE_ACTION_SLTP, "position": ticket, "sl": new_sl, "tp": 0.0, "magic": 123456}
-        pos = mt5.positions_get(ticket=ticket)
-        if pos: request["tp"] = pos[0].tp
+        request = self._SLTP_TEMPLATE.copy()
+        request.update(position=ticket, sl=new_sl)
+        pos = self._get_position(ticket, positions)
+        if pos: request["tp"] = pos.tp
         
         res = mt5.order_send(request)
         return res.retcode == mt5.TRADE_RETCODE_DONE
 
-    def _close_partial_mt5(self, ticket: int, volume_to_close: float) -> bool:
+    def _close_price(self, symbol: str, op_type: int, price: float = None) -> float:
+        """Fill price for a closing order: the caller's price if supplied, else one tick read (bid for SELL, ask for BUY)."""
+        if price:
+            return price
+        tick = mt5.symbol_info_tick(symbol)
+        return tick.bid if op_type == mt5.ORDER_TYPE_SELL else tick.ask
+
+    def _close_partial_mt5(self, ticket: int, volume_to_close: float, positions: dict = None, price: float = None) -> bool:
         if self.backtest_mode: return True
         
-        pos = mt5.positions_get(ticket=ticket)
-        if not pos: return False
+        position = self._get_position(ticket, positions)
+        if not position: return False
         
-        position = pos[0]
         close_action = mt5.ORDER_TYPE_SELL if position.type == mt5.ORDER_TYPE_BUY else mt5.ORDER_TYPE_BUY
         
-        request = {
-            "action": mt5.TRADE_ACTION_DEAL,
-            "position": ticket,
-            "symbol": position.symbol,
-            "volume": volume_to_close,
-            "type": close_action,
-            "price": mt5.symbol_info_tick(position.symbol).bid if close_action == mt5.ORDER_TYPE_SELL else mt5.symbol_info_tick(position.symbol).ask,
-            "deviation": 20,
-            "magic": 123456,
-            "comment": "Partial Close TP",
-            "type_time": mt5.ORDER_TIME_GTC,
-            "type_filling": mt5.ORDER_FILLING_IOC,
-        }
+        request = self._DEAL_TEMPLATE.copy()
+        request.update(position=ticket, symbol=position.symbol, volume=volume_to_close, type=close_action,
+                       price=self._close_price(position.symbol, close_action, price), comment="Partial Close TP")
         res = mt5.order_send(request)
         return res and res.retcode == mt5.TRADE_RETCODE_DONE
 
@@ -165,69 +266,102 @@ class ExecutionEngine:
         Returns: {'count': int, 'trades': list, 'closed_pnl': float, 'managed_count': int}
         """
         trades = self.load_state()
-        active_trades = []
+        to_remove = [] # Indices of closed trades, swept in-place after the scan
+        dirty = False  # Any trailing/partial change that must be persisted
         total_pnl = 0.0
         managed_count = 0
         
-        for trade in trades:
+        # One positions_get IPC per tick (indexed by ticket) instead of one per trade/modification
+        positions = None
+        if any(t.get("mode") == "LIVE" for t in trades) and mt5.initialize():
+            positions = {p.ticket: p for p in (mt5.positions_get(symbol=self.symbol) or [])}
+        
+        bt_closed, bt_pnl = self._check_backtest_exits(trades, current_price)
+        
+        for i, trade in enumerate(trades):
             ticket = trade.get("ticket")
             mode = trade.get("mode")
-            action = trade.get("action")
-            sl = trade.get("sl")
-            tp = trade.get("tp")
-            open_price = trade.get("open_price")
-            volume = trade.get("volume", 0.01)
             
             is_closed = False
             pnl = 0.0
-            updated = False
             
             # --- MONITORING LOGIC ---
             if mode == "BACKTEST":
-                if action == "BUY":
-                    if current_price <= sl: is_closed=True; pnl=(sl-open_price)*volume*100
-                    elif current_price >= tp: is_closed=True; pnl=(tp-open_price)*volume*100
-                elif action == "SELL":
-                    if current_price >= sl: is_closed=True; pnl=(open_price-sl)*volume*100
-                    elif current_price <= tp: is_closed=True; pnl=(open_price-tp)*volume*100
+                is_closed = bool(bt_closed[i])
+                pnl = float(bt_pnl[i])
                 
-                if is_closed: print(f"[BACKTEST] Trade {ticket} Closed. PnL: {pnl:.2f}")
+                if is_closed: logger.info("[BACKTEST] Trade %s Closed. PnL: %.2f", ticket, pnl)
 
             elif mode == "LIVE":
-                if mt5.initialize():
-                    positions = mt5.positions_get(ticket=int(ticket))
-                    if not positions:
+                if positions is not None:
+                    if int(ticket) not in positions:
                         # Closed in MT5
                         is_closed = True
-                        print(f"Trade {ticket} Closed in MT5.")
+                        logger.info("Trade %s Closed in MT5.", ticket)
                         # Logic to fetch real PnL omitted for space, assuming 0 or approx
             
             # --- MANAGEMENT LOGIC (If Active) ---
             if not is_closed:
                 # Apply Smart Trailing & Partial Profiling for BOTH Live and Mock
-                self.apply_trailing_stop(trade, current_price, atr, fractal_levels, gamma_state=gamma_state)
+                if self.apply_trailing_stop(trade, current_price, atr, fractal_levels, gamma_state=gamma_state, positions=positions):
+                    dirty = True
                 managed_count += 1 
 
             # --- FINALIZATION ---
             if is_closed:
                 total_pnl += pnl
-            else:
-                active_trades.append(trade)
+                to_remove.append(i)
+
+        for i in reversed(to_remove):
+            del trades[i]
 
-        # Update File
-        self.save_state(active_trades)
+        # Update File (only when something actually changed this tick)
+        if to_remove or dirty:
+            self.save_state(trades)
+            
+        flush_execution_log() # Tick is the batch boundary for buffered events
         
         return {
-            'count': len(active_trades),
-            'trades': active_trades,
+            'count': len(trades),
+            'trades': trades,
             'closed_pnl': total_pnl,
             'managed_count': managed_count
         }
 
-    def apply_trailing_stop(self, trade, current_price, atr, fractal_levels=None, gamma_state=None):
+    @staticmethod
+    def _check_backtest_exits(trades: list, current_price: float):
+        """
+        Vectorized SL/TP check for BACKTEST trades (struct-of-arrays over the trade list).
+        Returns (closed_mask, pnl) aligned with 'trades'; non-BACKTEST rows are never closed here.
+        SL takes priority over TP, matching the scalar BUY/SELL rules.
+        """
+        n = len(trades)
+        if n == 0:
+            return np.zeros(0, dtype=bool), np.zeros(0)
+            
+        sign_arr = np.array([
+            (1.0 if t.get("action") == "BUY" else -1.0 if t.get("action") == "SELL" else 0.0)
+            if t.get("mode") == "BACKTEST" else 0.0
+            for t in trades
+        ])
+        sl_arr = np.array([t.get("sl") for t in trades], dtype=float)
+        tp_arr = np.array([t.get("tp") for t in trades], dtype=float)
+        open_arr = np.array([t.get("open_price") for t in trades], dtype=float)
+        vol_arr = np.array([t.get("volume", 0.01) for t in trades], dtype=float)
+        
+        active = sign_arr != 0.0
+        sl_hit = active & ((current_price - sl_arr) * sign_arr <= 0)
+        tp_hit = active & ~sl_hit & ((current_price - tp_arr) * sign_arr >= 0)
+        
+        exit_arr = np.where(sl_hit, sl_arr, tp_arr)
+        pnl = np.where(sl_hit | tp_hit, (exit_arr - open_arr) * sign_arr * vol_arr * 100, 0.0)
+        return sl_hit | tp_hit, pnl
+
+    def apply_trailing_stop(self, trade, current_price, atr, fractal_levels=None, gamma_state=None, positions=None):
         """
         Dynamically moves Stop Loss based on profit milestones.
         Updates 'trade' dictionary in-place if successful.
+        Returns True if the trade was modified (partial close or SL move).
         """
         ticket = trade.get('ticket')
         entry_price = trade.get('open_price')
@@ -240,9 +374,10 @@ class ExecutionEngine:
         1. Break Even: If Profit > 1R.
         2. Fractal Trail: If Profit > 2R, Move SL to most recent Fractal Support/Resistance.
         """
+        updated = False
         try:
             risk = abs(entry_price - current_sl)
-            if risk == 0: return # Already at BE or weird state
+            if risk == 0: return False # Already at BE or weird state
             
             new_sl = None
             modification_reason = ""
@@ -253,8 +388,11 @@ class ExecutionEngine:
             # Logic: If Fractal is valid (not 0) use it. Else fallback to ATR? 
             # Actually user asked for Fractal. If no fractal, we hold current SL.
             
-            f_res = fractal_levels.get('resistance', 0.0) if fractal_levels else 0.0
-            f_sup = fractal_levels.get('support', 0.0) if fractal_levels else 0.0
+            if fractal_levels:
+                f_sup = fractal_levels.get('support', 0.0) or 0.0
+                f_res = fractal_levels.get('resistance', 0.0) or 0.0
+            else:
+                f_sup = f_res = 0.0
             
             # PHASE 92: GAMMA WALL DEFENSE 
             # If we are near a Gamma Wall, Trailing stops must squeeze tighter!
@@ -263,51 +401,31 @@ class ExecutionEngine:
             ts_buffer = (atr * 0.1) * gamma_ts_multiplier
             
             if action == "BUY":
-                profit = current_price - entry_price
-                
-                # Multi-Tier Partial Profiling (1.5R)
-                if profit > (1.5 * risk) and not trade.get('partial_closed', False):
-                     close_vol = max(0.01, round(volume * 0.5, 2))
-                     if self.backtest_mode or self._close_partial_mt5(int(ticket), close_vol):
-                         trade['partial_closed'] = True
-                         trade['volume'] = volume - close_vol # Reduce remaining volume
-                         print(f"💰 PARTIAL CLOSE SECURED (+1.5R): Ticket {ticket} closed {close_vol} lots.")
-                
-                # Trigger 1: Break Even (Profit > 1.0 * Risk) - Standard Trail
-                if profit > (1.0 * risk) and current_sl < entry_price:
-                    new_sl = entry_price + ts_buffer 
-                    modification_reason = "Break-Even (+1R)"
-                
-                # Trigger 2: Fractal Trailing (Profit > 2.0 * Risk)
-                elif profit > (2.0 * risk):
-                    # We want to trail to the LAST SUPPORT FRACTAL
-                    # Check if valid support fractal exists and is ABOVE current SL
-                    if f_sup > current_sl and f_sup < current_price:
-                         new_sl = f_sup - ts_buffer # Buffer below support
-                         modification_reason = "Structure Trail (Fractal)"
-
+                sign = 1.0
             elif action == "SELL":
-                profit = entry_price - current_price
-                
-                # Multi-Tier Partial Profiling (1.5R)
-                if profit > (1.5 * risk) and not trade.get('partial_closed', False):
-                     close_vol = max(0.01, round(volume * 0.5, 2))
-                     if self.backtest_mode or self._close_partial_mt5(int(ticket), close_vol):
-                         trade['partial_closed'] = True
-                         trade['volume'] = volume - close_vol
-                         print(f"💰 PARTIAL CLOSE SECURED (+1.5R): Ticket {ticket} closed {close_vol} lots.")
-                
-                # Trigger 1: Break Even
-                if profit > (1.0 * risk) and current_sl > entry_price:
-                    new_sl = entry_price - ts_buffer
-                    modification_reason = "Break-Even (+1R)"
+                sign = -1.0
+            else:
+                return False
                 
-                # Trigger 2: Fractal Trailing
-                elif profit > (2.0 * risk):
-                     # Trail to LAST RESISTANCE FRACTAL
-                     if f_res > 0 and f_res < current_sl and f_res > current_price:
-                         new_sl = f_res + ts_buffer # Buffer above resistance
-                         modification_reason = "Structure Trail (Fractal)"
+            sl_candidate, reason, take_partial = _trail_kernel(
+                sign, float(current_price), float(entry_price), float(current_sl),
+                float(risk), float(ts_buffer), float(f_sup), float(f_res)
+            )
+            
+            # Multi-Tier Partial Profiling (1.5R)
+            if take_partial and not trade.get('partial_closed', False):
+                 close_vol = max(0.01, round(volume * 0.5, 2))
+                 # Monitor prices are bids (main feeds tick.bid): only a BUY's closing side can reuse it
+                 close_px = current_price if sign > 0 else None
+                 if self.backtest_mode or self._close_partial_mt5(int(ticket), close_vol, positions, close_px):
+                     trade['partial_closed'] = True
+                     trade['volume'] = volume - close_vol # Reduce remaining volume
+                     updated = True
+                     logger.info("💰 PARTIAL CLOSE SECURED (+1.5R): Ticket %s closed %s lots.", ticket, close_vol)
+            
+            if reason != _TRAIL_NONE:
+                new_sl = sl_candidate
+                modification_reason = _TRAIL_REASONS[reason]
 
             # Execute Modification
             if new_sl:
@@ -315,15 +433,17 @@ class ExecutionEngine:
                 new_sl = round(new_sl, 5)
                 
                 # Use helper method to respect Mocking/Backtest Mode
-                if self.modify_order_sl(int(ticket), new_sl):
-                     print(f"✅ SL UPDATE ({modification_reason}): Ticket {ticket} -> {new_sl}")
+                if self.modify_order_sl(int(ticket), new_sl, positions):
+                     logger.info("✅ SL UPDATE (%s): Ticket %s -> %s", modification_reason, ticket, new_sl)
                      # Update local state so we don't spam requests
                      trade['sl'] = new_sl  # PERSIST CHANGE
+                     updated = True
                 else:
-                     print(f"⚠️ SL Update Failed (MT5 Error or connection).")
+                     logger.warning("⚠️ SL Update Failed (MT5 Error or connection).")
                     
         except Exception as e:
-            print(f"Trailing Stop Error: {e}")
+            logger.error("Trailing Stop Error: %s", e)
+        return updated
 
     def check_pyramiding_condition(self, active_trades: list, current_price: float) -> dict:
         """
@@ -395,7 +515,7 @@ class ExecutionEngine:
             # 1. Get Position Details to know Volume and Type
             positions = mt5.positions_get(ticket=int(ticket))
             if not positions:
-                print(f"Cannot close trade {ticket}: Not found in MT5.")
+                logger.warning("Cannot close trade %s: Not found in MT5.", ticket)
                 return False
                 
             pos = positions[0]
@@ -404,30 +524,21 @@ class ExecutionEngine:
             op_type = mt5.ORDER_TYPE_SELL if pos.type == mt5.ORDER_TYPE_BUY else mt5.ORDER_TYPE_BUY
             
             # 3. Send Close Order
-            request = {
-                "action": mt5.TRADE_ACTION_DEAL,
-                "position": pos.ticket,
-                "symbol": pos.symbol,
-                "volume": pos.volume,
-                "type": op_type,
-                "price": mt5.symbol_info_tick(pos.symbol).bid if op_type == mt5.ORDER_TYPE_SELL else mt5.symbol_info_tick(pos.symbol).ask,
-                "deviation": 20,
-                "magic": 234000,
-                "comment": "Cycle Close (Strategy)",
-                "type_time": mt5.ORDER_TIME_GTC,
-                "type_filling": mt5.ORDER_FILLING_IOC,
-            }
+            request = self._DEAL_TEMPLATE.copy()
+            request.update(position=pos.ticket, symbol=pos.symbol, volume=pos.volume, type=op_type,
+                           price=self._close_price(pos.symbol, op_type), magic=234000,
+                           comment="Cycle Close (Strategy)")
             
             res = mt5.order_send(request)
             if res.retcode == mt5.TRADE_RETCODE_DONE:
-                print(f"♻️ CYCLED TRADE {ticket} (Closed for Profit Rotation).")
+                logger.info("♻️ CYCLED TRADE %s (Closed for Profit Rotation).", ticket)
                 return True
             else:
-                print(f"⚠️ Failed to Cycle Trade {ticket}: {res.comment}")
+                logger.warning("⚠️ Failed to Cycle Trade %s: %s", ticket, res.comment)
                 return False
                 
         except Exception as e:
-            print(f"Close Trade Error: {e}")
+            logger.error("Close Trade Error: %s", e)
             return False
 
     def close_partial(self, ticket: int, fraction: float) -> bool:
@@ -439,7 +550,7 @@ class ExecutionEngine:
             if self.backtest_mode:
                 # In backtest mode, we can't actually split positions
                 # Just log it and return True
-                print(f"[BACKTEST] Would close {fraction*100:.0f}% of {ticket}")
+                logger.info("[BACKTEST] Would close %.0f%% of %s", fraction * 100, ticket)
                 return True
             
             if not mt5.initialize():
@@ -448,7 +559,7 @@ class ExecutionEngine:
             # 1. Get Position Details
             positions = mt5.positions_get(ticket=int(ticket))
             if not positions:
-                print(f"Cannot close partial {ticket}: Not found in MT5.")
+                logger.warning("Cannot close partial %s: Not found in MT5.", ticket)
                 return False
                 
             pos = positions[0]
@@ -456,30 +567,21 @@ class ExecutionEngine:
             # 2. Calculate Partial Volume
             close_volume = round(pos.volume * fraction, 2)
             if close_volume < 0.01:  # Minimum lot size
-                print(f"Partial volume too small ({close_volume:.2f}), skipping.")
+                logger.info("Partial volume too small (%.2f), skipping.", close_volume)
                 return False
             
             # 3. Determine Opposite Action
             op_type = mt5.ORDER_TYPE_SELL if pos.type == mt5.ORDER_TYPE_BUY else mt5.ORDER_TYPE_BUY
             
             # 4. Send Partial Close Order
-            request = {
-                "action": mt5.TRADE_ACTION_DEAL,
-                "position": pos.ticket,
-                "symbol": pos.symbol,
-                "volume": close_volume,  # Partial volume
-                "type": op_type,
-                "price": mt5.symbol_info_tick(pos.symbol).bid if op_type == mt5.ORDER_TYPE_SELL else mt5.symbol_info_tick(pos.symbol).ask,
-                "deviation": 20,
-                "magic": 234001,
-                "comment": "Partial Profit Take",
-                "type_time": mt5.ORDER_TIME_GTC,
-                "type_filling": mt5.ORDER_FILLING_IOC,
-            }
+            request = self._DEAL_TEMPLATE.copy()
+            request.update(position=pos.ticket, symbol=pos.symbol, volume=close_volume, # Partial volume
+                           type=op_type, price=self._close_price(pos.symbol, op_type), magic=234001,
+                           comment="Partial Profit Take")
             
             res = mt5.order_send(request)
             if res.retcode == mt5.TRADE_RETCODE_DONE:
-                print(f"✅ PARTIAL CLOSE: {close_volume} lots of {ticket} closed (${res.price:.5f})")
+                logger.info("✅ PARTIAL CLOSE: %s lots of %s closed ($%.5f)", close_volume, ticket, res.price)
                 
                 # BUG FIX: MT5 Ticket Mutation (Hedging Mode generates new ticket)
                 import time
@@ -499,7 +601,7 @@ class ExecutionEngine:
                             break
                             
                 if str(new_ticket_id) != str(ticket):
-                    print(f"🔄 Ticket Mutated on Partial Close: {ticket} -> {new_ticket_id}")
+                    logger.info("🔄 Ticket Mutated on Partial Close: %s -> %s", ticket, new_ticket_id)
                     states = self.load_state()
                     for t in states:
                         if str(t['ticket']) == str(ticket):
@@ -508,11 +610,11 @@ class ExecutionEngine:
                     
                 return True
             else:
-                print(f"⚠️ Failed to Partial Close {ticket}: {res.comment} (Code: {res.retcode})")
+                logger.warning("⚠️ Failed to Partial Close %s: %s (Code: %s)", ticket, res.comment, res.retcode)
                 return False
                 
         except Exception as e:
-            print(f"Partial Close Error: {e}")
+            logger.error("Partial Close Error: %s", e)
             return False
 
     def _mark_trade_pyramided(self, ticket) -> bool:
@@ -535,5 +637,5 @@ class ExecutionEngine:
             return False
             
         except Exception as e:
-            print(f"Pyramid Marking Error: {e}")
+            logger.error("Pyramid Marking Error: %s", e)
             return False
@@ -0,0 +1,79 @@
+"""
+Numba indicator kernels (EMA family, sliding windows and the SuperTrend recurrence).
+EMA: same recurrence as pandas `ewm(..., adjust=False).mean()` (s_t = a*x_t + (1-a)*s_{t-1}),
+but as one compiled loop over a float64 array instead of pandas' EWM dispatch.
+Only worth calling when Numba is installed (see NUMBA_AVAILABLE); the pure-Python
+fallback loops are slower than pandas.
+"""
+import numpy as np
+from app.jit import njit, NUMBA_AVAILABLE
+
+@njit(cache=True, fastmath=True)
+def ema_alpha(x, alpha):
+    """Exponential smoothing with an explicit alpha (Wilder: alpha = 1/length). `x` must be NaN-free."""
+    out = np.empty_like(x)
+    if len(x) == 0:
+        return out
+    beta = 1.0 - alpha
+    out[0] = x[0]
+    for i in range(1, len(x)):
+        out[i] = alpha * x[i] + beta * out[i - 1]
+    return out
+
+@njit(cache=True, fastmath=True)
+def ema_span(x, span):
+    """Span-based EMA (alpha = 2 / (span + 1)), matching ewm(span=span, adjust=False)."""
+    return ema_alpha(x, 2.0 / (span + 1.0))
+
+@njit(cache=True)
+def rolling_mean_std(x, window):
+    """
+    Rolling mean and sample std (ddof=1) in one O(n) pass with running sums,
+    matching rolling(window).mean()/.std(): NaN until the window is full. `x` must be NaN-free.
+    Sums are taken around x[0] so large price levels don't cancel out the variance.
+    """
+    n = len(x)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if n == 0 or window < 2:
+        return mean, std
+    k = x[0]
+    s = 0.0
+    s2 = 0.0
+    for i in range(n):
+        v = x[i] - k
+        s += v
+        s2 += v * v
+        if i >= window:
+            old = x[i - window] - k
+            s -= old
+            s2 -= old * old
+        if i >= window - 1:
+            m = s / window
+            mean[i] = m + k
+            std[i] = np.sqrt(max((s2 - s * m) / (window - 1), 0.0))
+    return mean, std
+
+@njit(cache=True)
+def supertrend_kernel(close, upper_band, lower_band):
+    """
+    SuperTrend state recurrence over float64 arrays. Returns (supertrend, trend) with trend +1/-1.
+    Same branches as the Python max()/min() it replaces, including their NaN handling
+    (a NaN band propagates; a NaN previous level is replaced by the band), so no fastmath.
+    """
+    n = len(close)
+    st = np.empty(n)
+    trend = np.empty(n, np.int8)
+    if n == 0:
+        return st, trend
+    st[0] = lower_band[0]
+    trend[0] = 1 # Assume uptrend initially
+    for i in range(1, n):
+        prev = st[i - 1]
+        if close[i] > prev:
+            trend[i] = 1
+            st[i] = prev if prev > lower_band[i] else lower_band[i]
+        else:
+            trend[i] = -1
+            st[i] = prev if prev < upper_band[i] else upper_band[i]
+    return st, trend
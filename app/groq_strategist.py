@@ -2,87 +2,211 @@ import os
 import json
 import re
 import time
-from groq import Groq
+import random
+import copy
+import hashlib
+import threading
+import weakref
+from types import MappingProxyType
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import groq
+from groq import Groq, AsyncGroq
+from cachetools import TTLCache
 from app.config import Config
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Bound once at import: orjson (accepts str or bytes) with stdlib json as the fallback.
+# Both raise ValueError subclasses on malformed input.
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Zero Trust setup markers (SMC zone, Gate 4, Darwin signal) scanned in a single pass
+_GATE_RE = re.compile(r'INSIDE_ZONE \(READY\)|\[GATE 4 PASSED\]|\[SIGNAL REQUEST\]')
+_GATE_FLAGS = {"INSIDE_ZONE (READY)": "smc", "[GATE 4 PASSED]": "gate4", "[SIGNAL REQUEST]": "signal"}
+
+# One Groq client per process: every GroqStrategist shares its keep-alive pool, so a new
+# instance never pays a fresh TCP+TLS handshake. Don't wrap it in `with Groq(...)` in a loop.
+_client = None
+
+def _get_client(api_key: str) -> Groq:
+    global _client
+    if _client is None:
+        _client = Groq(
+            api_key=api_key,
+            http_client=httpx.Client(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=10.0
+            )
+        )
+    return _client
+
+_warmup_started = False
+
+def _warm_up(client: Groq):
+    """Opens the pooled connection in the background (one cheap models.list()) so TLS and
+    httpx setup are paid at boot rather than by the first live decision."""
+    global _warmup_started
+    if _warmup_started:
+        return
+    _warmup_started = True
+    
+    def _ping():
+        try:
+            client.with_options(timeout=5.0).models.list()
+        except Exception as e:
+            print(f"Groq Warmup Skipped: {e}")
+            
+    threading.Thread(target=_ping, name="groq-warmup", daemon=True).start()
+
+# Async twin of the shared client, used by get_trade_decision_async for per-symbol fan-out.
+# httpx.AsyncClient pools are bound to the loop they first run on, so there is one client
+# per event loop (each asyncio.run() gets its own); entries go away with their loop.
+_aclients = weakref.WeakKeyDictionary()
+_ASYNC_CONCURRENCY = 48 # Throughput saturates around here before rate limits bite
+
+def _get_async_client(api_key: str) -> AsyncGroq:
+    loop = asyncio.get_running_loop()
+    aclient = _aclients.get(loop)
+    if aclient is None:
+        aclient = AsyncGroq(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=10.0
+            )
+        )
+        _aclients[loop] = aclient
+    return aclient
+
 class GroqStrategist:
-    def __init__(self, model: str = "llama-3.3-70b-versatile"):
+    RETRY_MAX_DELAY = 10.0       # Ceiling (seconds) for jittered exponential backoff between attempts
+    DECISION_CACHE_TTL = 30.0    # Seconds an identical context reuses the last decision
+    DECISION_CACHE_SIZE = 512    # Distinct (model, summary, performance) contexts kept
+    BATCH_MAX_SYMBOLS = 8        # Symbols per batched call; latency climbs sharply beyond this
+    DECISION_MAX_TOKENS = 200    # Decision JSON is ~80 tokens; cap generation instead of the model default
+    NEWS_MAX_TOKENS = 150
+    PARSE_ERROR = "JSON Parse Error" # reasoning_summary prefix of the HOLD returned for an unparsable reply
+
+    # Read-only fallback returned (as a copy) when every attempt fails
+    _API_FAILURE = MappingProxyType({
+        "action": "HOLD",
+        "confidence_score": 0.0,
+        "reasoning_summary": "API Failure",
+        "stop_loss_atr_multiplier": 1.0
+    })
+
+    # Phase 60 news-impact prompt, built once per process
+    _NEWS_SYSTEM_MSG = {"role": "system", "content": (
+        "You are a Senior Global Macro Strategist. A High-Impact Economic Event just occurred.\n"
+        "Your job is to interpret the 'Actual' vs 'Forecast' deviation and issue an immediate trading signal.\n"
+        "RULES:\n"
+        "1. DEVIATION IS KING. Significant deviation -> Strong Signal.\n"
+        "2. CONTEXT MATTERS. If Trend matches the News -> CONFIRMED ENTRY.\n"
+        "3. BE DECISIVE. Do not hedge. Buy, Sell, or Stand Aside.\n"
+        "JSON OUTPUT: { \"action\": \"BUY\"|\"SELL\"|\"HOLD\", \"reasoning\": \"str\" }"
+    )}
+    _NEWS_TEMPLATE = (
+        "EVENT: {currency} {event}\n"
+        "FORECAST: {forecast}\n"
+        "ACTUAL: {actual}\n"
+        "PREVIOUS: {previous}\n"
+        "\n"
+        "CURRENT MARKET TREND (M15): {trend}\n"
+        "\n"
+        "Task:\n"
+        "1. Calculate the Deviation (Actual - Forecast).\n"
+        "2. Assess impact on {currency} (Positive/Negative?).\n"
+        "3. If {currency} is USD:\n"
+        "   - Positive News -> Bearish EURUSD (SELL).\n"
+        "   - Negative News -> Bullish EURUSD (BUY).\n"
+        "4. If {currency} is EUR:\n"
+        "   - Positive News -> Bullish EURUSD (BUY).\n"
+        "   - Negative News -> Bearish EURUSD (SELL).\n"
+        "\n"
+        "DECISION?"
+    )
+    NEWS_BATCH_MAX_EVENTS = 5
+    _NEWS_BATCH_LINE = "[{n}] {currency} {event} | FORECAST: {forecast} | ACTUAL: {actual} | PREVIOUS: {previous}"
+    _NEWS_BATCH_TEMPLATE = (
+        "EVENTS (released together):\n"
+        "{events}\n"
+        "\n"
+        "CURRENT MARKET TREND (M15): {trend}\n"
+        "\n"
+        "Task, for EACH event independently:\n"
+        "1. Calculate the Deviation (Actual - Forecast).\n"
+        "2. Assess impact on its currency (Positive/Negative?).\n"
+        "3. USD: Positive News -> Bearish EURUSD (SELL), Negative News -> Bullish EURUSD (BUY).\n"
+        "4. EUR: Positive News -> Bullish EURUSD (BUY), Negative News -> Bearish EURUSD (SELL).\n"
+        "\n"
+        "Respond with a JSON object {{\"decisions\": [...]}} holding exactly {count} objects, in event order."
+    )
+
+    def __init__(self, model: str = None):
         self.api_key = Config.GROQ_API_KEY
         if not self.api_key:
             raise ValueError("GROQ_API_KEY not found in configuration.")
         
-        self.client = Groq(api_key=self.api_key)
-        self.model = model 
+        # Shared keep-alive pool: retries, ticks and other instances reuse the TLS connection
+        self.client = _get_client(self.api_key)
+        if Config.GROQ_WARMUP:
+            _warm_up(self.client)
+        self.model = model or Config.GROQ_MODEL
+        # News path runs on the small/fast model unless the flag routes it back to the main model
+        self.news_model = Config.NEWS_MODEL if Config.FAST_NEWS_MODEL else self.model
+        # blake2b(model|summary|performance) -> decision; lock because async/batch callers share it
+        self._decision_cache = TTLCache(maxsize=self.DECISION_CACHE_SIZE, ttl=self.DECISION_CACHE_TTL)
+        self._cache_lock = threading.Lock()
+        # Concurrency cap for get_trade_decision_async, one semaphore per event loop
+        # (an asyncio.Semaphore can't be shared across loops)
+        self._async_sems = weakref.WeakKeyDictionary()
         
-        self.system_prompt = (
-            "You are a Senior Quantitative Portfolio Manager (Hedge Fund). You trade with cold, calculated mathematical precision.\n"
-            "YOUR GOAL: Maximize Sharpe Ratio. Minimize Drawdown. Quality > Quantity.\n"
-            "\n"
-            "--- MARKET PHYSICS (BIF ENGINE) ---\n"
-            "1. REGIME AWARENESS (HURST EXPONENT): \n"
-            "   - If Hurst > 0.55 (TRENDING): You are a Trend Follower. TRUST FRACTAL BREAKOUTS. Buy Strength. Sell Weakness.\n"
-            "   - If Hurst < 0.45 (MEAN REVERSION): You are in Safety Mode. IGNORE Breakouts (Fakeouts likely). Wait for Extremes.\n"
-            "   - If Hurst is 0.45-0.55 (RANDOM): CASH IS KING. Do not trade.\n"
-            "2. SIGNAL QUALITY (ENTROPY):\n"
-            "   - If Entropy > 0.90: MARKET IS NOISY. Reduce size or HOLD. Do not gamble.\n"
-            "\n"
-            "--- ENTRY RULES (THE GATE) ---\n"
-            "You may ONLY enter if ONE of the following is true (AND confirmed by Gate 4):\n"
-            "A. [SMC ORDER BLOCK]: Price is INSIDE a confirmed Order Block.\n"
-            "B. [TREND BREAKOUT]: A validated Bill Williams Fractal Breakout + Confluence.\n"
-            "C. [JURY SIGNAL]: The Darwin Swarm has issued a High-Confidence Signal (Mean Reversion/Momentum).\n"
-            "\n"
-            "CRITICAL: INDICATORS (RSI/MACD) ARE CONFIRMATIONS ONLY.\n"
-            "NEVER trade solely because 'RSI is low'. There MUST be a Structural Reason (OB or Fractal Break).\n"
-            "\n"
-            "--- EXECUTION LOGIC ---\n"
-            "- BUY: (Bullish Regime OR Bullish Catalyst) AND (Valid Structure [GATE 4 PASSED]).\n"
-            "- SELL: (Bearish Regime OR Bearish Catalyst) AND (Valid Structure [GATE 4 PASSED]).\n"
-            "- HOLD: No Setup, High Entropy, or Conflicting Signals.\n"
-            "\n"
-            "JSON OUTPUT FORMAT:\n"
-            "{"
-            "\"action\": \"BUY\"|\"SELL\"|\"HOLD\", "
-            "\"confidence_score\": 0.0-1.0, "
-            "\"reasoning\": \"REGIME: [Trend/Range]. STRUCTURE: [Fractal/OB]. CONFIRMATION: [Indicators]. DECISION: [Final].\""
-            "}"
-        )
+        # Compact rule grammar: every prompt token is prefill latency on every call.
+        # JSON mode enforces the shape, so only the key names are spelled out.
+        self.system_prompt = """Role: Senior Quant PM. Goal: max Sharpe, min drawdown, quality > quantity.
+REGIME (Hurst): >0.55 trend -> trust fractal breakouts, follow strength | <0.45 mean-revert -> ignore breakouts, fade extremes | 0.45-0.55 random -> HOLD.
+NOISE: Entropy > 0.90 -> HOLD.
+ENTRY needs one structural trigger confirmed by [GATE 4 PASSED]: (A) price INSIDE an SMC Order Block, (B) validated Bill Williams fractal breakout + confluence, (C) high-confidence Darwin Jury signal.
+RSI/MACD are confirmation only, never a reason to trade.
+BUY/SELL = regime or catalyst in that direction AND valid structure. Otherwise HOLD.
+Reply keys: action (BUY|SELL|HOLD), confidence_score (0.0-1.0), reasoning ("REGIME: .. STRUCTURE: .. CONFIRMATION: .. DECISION: ..")."""
+        # Built once and reused by every decision call: a byte-identical system prefix lets the
+        # provider reuse its prefill across requests. Keep dates/counters out of the system prompt.
+        self._system_msg = {"role": "system", "content": self.system_prompt}
+
+    def _normalize_decision(self, data: dict) -> dict:
+        """Maps AI keys to system keys and clamps the action to BUY/SELL/HOLD."""
+        # Map simplified AI keys to System keys
+        if "reasoning" in data and "reasoning_summary" not in data:
+            data["reasoning_summary"] = data["reasoning"]
+        
+        # Normalize action
+        data['action'] = str(data.get('action', 'HOLD')).upper()
+        if data['action'] not in ["BUY", "SELL", "HOLD"]:
+            data['action'] = "HOLD" 
+            
+        return data
 
     def _parse_response(self, content: str) -> dict:
-        """Attempts to parse JSON from the response. Uses Regex for robustness."""
+        """Parses the JSON-mode reply (the API guarantees a syntactically valid object)."""
         try:
-            # 1. Try Regex Extraction (Finds outermost brackets)
-            json_match = re.search(r'\{[\s\S]*\}', content)
-            if json_match:
-                cleaned = json_match.group(0)
-            else:
-                cleaned = content.strip()
+            data = _json_loads(content)
+            if not isinstance(data, dict):
+                raise ValueError("Top-level JSON is not an object")
+            return self._normalize_decision(data)
             
-            # SANITIZATION: Fix common LLM JSON syntax errors
-            cleaned = cleaned.replace(r"\_", "_") # Fix escaped underscores
-            cleaned = cleaned.replace(r"\n", " ") # Remove newlines in strings
-             # Fix escaped quotes if they aren't structural (harder, but usually the above fixes it)
-            
-            # 2. Parse
-            data = json.loads(cleaned)
-            
-            # Map simplified AI keys to System keys
-            if "reasoning" in data and "reasoning_summary" not in data:
-                data["reasoning_summary"] = data["reasoning"]
-            
-            # Normalize action
-            data['action'] = data['action'].upper()
-            if data['action'] not in ["BUY", "SELL", "HOLD"]:
-                data['action'] = "HOLD" 
-                
-            return data
-            
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             print(f"FAILED TO PARSE JSON. RAW CONTENT:\n{content}\nERROR: {e}")
             return {
                 "action": "HOLD",
                 "confidence_score": 0.0,
-                "reasoning_summary": f"JSON Parse Error: {str(e)[:50]}...",
+                "reasoning_summary": f"{self.PARSE_ERROR}: {str(e)[:50]}...",
                 "stop_loss_atr_multiplier": 1.0
             }
 
@@ -92,45 +216,19 @@ class GroqStrategist:
         Called when a High Impact actual value is released.
         Returns JSON: { "action": "BUY/SELL/HOLD", "reasoning": "..." }
         """
-        news_prompt = (
-            "You are a Senior Global Macro Strategist. A High-Impact Economic Event just occurred.\n"
-            "Your job is to interpret the 'Actual' vs 'Forecast' deviation and issue an immediate trading signal.\n"
-            "RULES:\n"
-            "1. DEVIATION IS KING. Significant deviation -> Strong Signal.\n"
-            "2. CONTEXT MATTERS. If Trend matches the News -> CONFIRMED ENTRY.\n"
-            "3. BE DECISIVE. Do not hedge. Buy, Sell, or Stand Aside.\n"
-            "JSON OUTPUT: { \"action\": \"BUY\"|\"SELL\"|\"HOLD\", \"reasoning\": \"str\" }"
-        )
-
-        user_content = f"""
-        EVENT: {event['currency']} {event['event']}
-        FORECAST: {event['forecast']}
-        ACTUAL: {event['actual']}
-        PREVIOUS: {event['previous']}
-        
-        CURRENT MARKET TREND (M15): {current_trend}
-        
-        Task:
-        1. Calculate the Deviation (Actual - Forecast).
-        2. Assess impact on {event['currency']} (Positive/Negative?).
-        3. If {event['currency']} is USD:\n"
-             - Positive News -> Bearish EURUSD (SELL).\n"
-             - Negative News -> Bullish EURUSD (BUY).\n"
-        4. If {event['currency']} is EUR:\n"
-             - Positive News -> Bullish EURUSD (BUY).\n"
-             - Negative News -> Bearish EURUSD (SELL).\n"
-             
-        DECISION?
-        """
+        # Static template: only the event fields are substituted per call (bursts at NFP/CPI)
+        user_content = self._NEWS_TEMPLATE.format_map({**event, "trend": current_trend})
         
         try:
             chat_completion = self.client.chat.completions.create(
                 messages=[
-                    {"role": "system", "content": news_prompt},
+                    self._NEWS_SYSTEM_MSG,
                     {"role": "user", "content": user_content}
                 ],
-                model=self.model,
-                temperature=0.1,
+                model=self.news_model,
+                temperature=0.0,
+                max_tokens=self.NEWS_MAX_TOKENS,
+                response_format={"type": "json_object"},
             )
             response = chat_completion.choices[0].message.content
             return self._parse_response(response)
@@ -139,18 +237,85 @@ class GroqStrategist:
             print(f"News Analysis Error: {e}")
             return {"action": "HOLD", "reasoning": "AI Failure"}
 
-    def _validate_decision_against_context(self, decision: dict, market_data: str) -> dict:
+    def analyze_news_impact_batch(self, events: list, current_trend: str) -> list:
+        """
+        Analyzes releases that land together (NFP/CPI windows) with one call per
+        NEWS_BATCH_MAX_EVENTS events; several chunks run in parallel on the shared pool.
+        Returns one decision per event, in order.
+        """
+        if len(events) <= 1:
+            return [self.analyze_news_impact(event, current_trend) for event in events]
+            
+        chunks = [events[i:i + self.NEWS_BATCH_MAX_EVENTS] for i in range(0, len(events), self.NEWS_BATCH_MAX_EVENTS)]
+        if len(chunks) == 1:
+            return self._analyze_news_chunk(chunks[0], current_trend)
+            
+        with ThreadPoolExecutor(max_workers=min(len(chunks), _ASYNC_CONCURRENCY)) as pool:
+            results = pool.map(lambda chunk: self._analyze_news_chunk(chunk, current_trend), chunks)
+            return [decision for chunk_result in results for decision in chunk_result]
+
+    def _analyze_news_chunk(self, events: list, current_trend: str) -> list:
+        if len(events) == 1:
+            return [self.analyze_news_impact(events[0], current_trend)]
+            
+        try:
+            lines = "\n".join(self._NEWS_BATCH_LINE.format_map({**event, "n": i + 1}) for i, event in enumerate(events))
+            user_content = self._NEWS_BATCH_TEMPLATE.format(events=lines, trend=current_trend, count=len(events))
+            
+            chat_completion = self.client.chat.completions.create(
+                messages=[
+                    self._NEWS_SYSTEM_MSG,
+                    {"role": "user", "content": user_content}
+                ],
+                model=self.news_model,
+                temperature=0.0,
+                max_tokens=self.NEWS_MAX_TOKENS * len(events),
+                response_format={"type": "json_object"}, # JSON mode requires a top-level object, not an array
+            )
+            data = _json_loads(chat_completion.choices[0].message.content)
+            items = data.get('decisions') if isinstance(data, dict) else None
+            if not isinstance(items, list) or len(items) != len(events) or not all(isinstance(d, dict) for d in items):
+                raise ValueError(f"Expected {len(events)} decisions in news batch reply")
+            return [self._normalize_decision(item) for item in items]
+            
+        except Exception as e:
+            # Misaligned or failed batch -> fall back to per-event calls
+            print(f"News Batch Error ({len(events)} events): {e}. Falling back to single calls.")
+            return [self.analyze_news_impact(event, current_trend) for event in events]
+
+    @staticmethod
+    def _setup_flags(market_data: str) -> dict:
+        """One scan of the context for the Zero Trust setup markers: {'smc', 'gate4', 'signal'} -> bool."""
+        flags = dict.fromkeys(_GATE_FLAGS.values(), False)
+        for match in _GATE_RE.finditer(market_data):
+            flags[_GATE_FLAGS[match.group(0)]] = True
+        return flags
+
+    @staticmethod
+    def _no_setup_decision() -> dict:
+        """HOLD returned without an API call when the context carries no tradeable setup."""
+        return {
+            "action": "HOLD",
+            "confidence_score": 0.0,
+            "reasoning_summary": "[BLOCK] No Valid Setup (Zone/Gate 4/Signal) in context. AI not consulted.",
+            "stop_loss_atr_multiplier": 1.0
+        }
+
+    def _validate_decision_against_context(self, decision: dict, market_data: str, flags: dict = None) -> dict:
         """
         ZERO TRUST LAYER:
         Overrides AI decision if strict conditions are not met in the context string.
+        `flags` is the _setup_flags() result when the caller has already scanned the context.
         """
-        # Rule: Must have [INSIDE_ZONE (READY)] OR [GATE 4 PASSED] to trade
-        # If neither is present, block the trade.
-        has_smc = "INSIDE_ZONE (READY)" in market_data
-        has_gate4 = "[GATE 4 PASSED]" in market_data
-        has_darwin = "[SIGNAL REQUEST]" in market_data
-        
-        if not has_smc and not has_gate4 and not has_darwin and decision['action'] != "HOLD":
+        # HOLD needs no justification -> skip scanning the context entirely
+        if decision['action'] == "HOLD":
+            return decision
+            
+        # Rule: Must have [INSIDE_ZONE (READY)] OR [GATE 4 PASSED] (or a Darwin [SIGNAL REQUEST]) to trade
+        # If none is present, block the trade.
+        if flags is None:
+            flags = self._setup_flags(market_data)
+        if not any(flags.values()):
             print(f"[BLOCK] ZERO TRUST INTERVENTION: AI attempted to trade without valid Setup.")
             decision['action'] = "HOLD"
             decision['confidence_score'] = 0.0
@@ -158,63 +323,216 @@ class GroqStrategist:
             
         return decision
 
-    def get_trade_decision(self, market_data_summary: str, performance_context: str = "") -> dict:
-        """
-        Sends market data + performance context to Groq API and returns structured JSON decision.
-        """
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                prompt = f"""
+    def _decision_messages(self, market_data_summary: str, performance_context: str) -> list:
+        """Builds the chat messages shared by the sync and async decision paths."""
+        prompt = f"""
         Analyze the following market data and make a trading decision.
         
         {market_data_summary}
         
         {performance_context}
         
-        CRITICAL: Output strictly valid JSON.
-        - Do NOT use Markdown code blocks (```json).
-        - Do NOT add comments.
-        - Escape all quotes inside strings.
+        Respond with the JSON object only.
+        """
+        return [
+            self._system_msg,
+            {"role": "user", "content": prompt}
+        ]
+
+    def _cache_key(self, market_data_summary: str, performance_context: str) -> bytes:
+        return hashlib.blake2b(
+            f"{self.model}|{market_data_summary}|{performance_context}".encode(), digest_size=16
+        ).digest()
+
+    def _cache_get(self, cache_key: bytes):
+        """Returns a private copy of a cached decision, or None on miss/expiry."""
+        with self._cache_lock:
+            cached = self._decision_cache.get(cache_key)
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def _cache_put(self, cache_key: bytes, decision: dict):
+        with self._cache_lock:
+            self._decision_cache[cache_key] = copy.deepcopy(decision)
+
+    def _retry_delay(self, error: Exception, attempt: int):
+        """
+        Seconds to wait before retrying after `error`, or None if retrying is pointless.
+        - BadRequest: the model/API rejected the prompt -> abort, a retry just burns budget.
+        - RateLimit: honour Retry-After when present, else exponential; plus jitter.
+        - Connection: transient network blip -> quick jittered retry.
         """
+        if isinstance(error, groq.BadRequestError):
+            return None
+        if isinstance(error, groq.RateLimitError):
+            try:
+                base = float(error.response.headers.get("retry-after"))
+            except (AttributeError, TypeError, ValueError):
+                base = 2 ** attempt
+            return min(base + random.random(), self.RETRY_MAX_DELAY)
+        if isinstance(error, groq.APIConnectionError):
+            return random.uniform(0.0, 0.5)
+        return min(2 ** attempt + random.random(), self.RETRY_MAX_DELAY)
 
+    def get_trade_decision(self, market_data_summary: str, performance_context: str = "") -> dict:
+        """
+        Sends market data + performance context to Groq API and returns structured JSON decision.
+        """
+        # No setup marker -> Zero Trust would force HOLD anyway, so skip the API round-trip
+        flags = self._setup_flags(market_data_summary)
+        if not any(flags.values()):
+            return self._no_setup_decision()
+            
+        # Identical context within the TTL (no new bar/news) -> skip the API round-trip
+        cache_key = self._cache_key(market_data_summary, performance_context)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+            
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
                 chat_completion = self.client.chat.completions.create(
-                    messages=[
-                        {"role": "system", "content": self.system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
+                    messages=self._decision_messages(market_data_summary, performance_context),
                     model=self.model,
-                    temperature=0.1, # Low temp for logic
+                    temperature=0.0, # Deterministic -> identical contexts are cacheable
+                    max_tokens=self.DECISION_MAX_TOKENS,
+                    response_format={"type": "json_object"}, # Server-enforced JSON: no prose/fences to strip
                 )
 
                 response_content = chat_completion.choices[0].message.content
                 decision = self._parse_response(response_content)
+                # A truncated/garbled reply must not pin its HOLD for the whole TTL
+                parsed = not str(decision.get("reasoning_summary", "")).startswith(self.PARSE_ERROR)
                 
                 # Apply Zero Trust Filter
-                decision = self._validate_decision_against_context(decision, market_data_summary)
+                decision = self._validate_decision_against_context(decision, market_data_summary, flags)
                 
+                if parsed:
+                    self._cache_put(cache_key, decision)
                 return decision
 
             except Exception as e:
                 print(f"Groq API Error (Attempt {attempt+1}): {e}")
-                if attempt == max_retries - 1:
-                    return {
-                        "action": "HOLD",
-                        "confidence_score": 0.0,
-                        "reasoning_summary": "API Failure",
-                        "stop_loss_atr_multiplier": 1.0
-                    }
+                delay = self._retry_delay(e, attempt)
+                if attempt == max_retries - 1 or delay is None:
+                    return dict(self._API_FAILURE)
+                time.sleep(delay)
+
+    async def get_trade_decision_async(self, market_data_summary: str, performance_context: str = "") -> dict:
+        """
+        Async get_trade_decision for multi-symbol ticks:
+        `await asyncio.gather(*(strat.get_trade_decision_async(ctx) for ctx in contexts))`
+        overlaps the per-request latency instead of paying it N times in series.
+        """
+        # No setup marker -> Zero Trust would force HOLD anyway, so skip the API round-trip
+        flags = self._setup_flags(market_data_summary)
+        if not any(flags.values()):
+            return self._no_setup_decision()
+            
+        cache_key = self._cache_key(market_data_summary, performance_context)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+            
+        loop = asyncio.get_running_loop()
+        sem = self._async_sems.get(loop)
+        if sem is None:
+            sem = self._async_sems[loop] = asyncio.Semaphore(_ASYNC_CONCURRENCY)
+        aclient = _get_async_client(self.api_key)
         
-        # This part of the code will only be reached if max_retries is 0 or less, or if the loop finishes without returning.
-        # Given the current structure, the last attempt's error handling will return.
-        # This line is technically unreachable with max_retries > 0 and the if condition inside the loop.
-        # However, to match the user's provided snippet for the final fallback:
-        return {
-            "action": "HOLD",
-            "confidence_score": 0.0,
-            "reasoning_summary": "Max Retries Exceeded",
-            "stop_loss_atr_multiplier": 1.0
-        }
+        max_retries = 3
+        for attempt in range(max_retries):
+            try:
+                async with sem:
+                    chat_completion = await aclient.chat.completions.create(
+                        messages=self._decision_messages(market_data_summary, performance_context),
+                        model=self.model,
+                        temperature=0.0,
+                        max_tokens=self.DECISION_MAX_TOKENS,
+                        response_format={"type": "json_object"},
+                    )
+
+                decision = self._parse_response(chat_completion.choices[0].message.content)
+                parsed = not str(decision.get("reasoning_summary", "")).startswith(self.PARSE_ERROR)
+                decision = self._validate_decision_against_context(decision, market_data_summary, flags)
+                
+                if parsed:
+                    self._cache_put(cache_key, decision)
+                return decision
+
+            except Exception as e:
+                print(f"Groq API Error (Async Attempt {attempt+1}): {e}")
+                delay = self._retry_delay(e, attempt)
+                if attempt == max_retries - 1 or delay is None:
+                    return dict(self._API_FAILURE)
+                await asyncio.sleep(delay)
+
+    def get_trade_decisions_batch(self, summaries: list, performance_context: str = "") -> list:
+        """
+        Decides several symbols per API call (up to BATCH_MAX_SYMBOLS), amortizing the
+        fixed request latency and RPM budget. Returns one decision per summary, in order.
+        """
+        decisions = [None] * len(summaries)
+        gated = []
+        for idx, summary in enumerate(summaries):
+            if any(self._setup_flags(summary).values()):
+                gated.append(idx)
+            else:
+                decisions[idx] = self._no_setup_decision()
+                
+        if len(gated) <= 1:
+            for idx in gated:
+                decisions[idx] = self.get_trade_decision(summaries[idx], performance_context)
+            return decisions
+            
+        for start in range(0, len(gated), self.BATCH_MAX_SYMBOLS):
+            chunk_idx = gated[start:start + self.BATCH_MAX_SYMBOLS]
+            chunk = [summaries[idx] for idx in chunk_idx]
+            if len(chunk) == 1:
+                decisions[chunk_idx[0]] = self.get_trade_decision(chunk[0], performance_context)
+                continue
+                
+            symbols_block = "\n".join(f"[{i+1}] {summary}" for i, summary in enumerate(chunk))
+            prompt = f"""
+        Analyze each of the following symbols independently and make a trading decision for each.
+        
+        Symbols:
+        {symbols_block}
+        
+        {performance_context}
+        
+        Respond with a JSON object {{"decisions": [...]}} holding exactly {len(chunk)} decision objects, in the same order.
+        """
+            try:
+                chat_completion = self.client.chat.completions.create(
+                    messages=[
+                        self._system_msg,
+                        {"role": "user", "content": prompt}
+                    ],
+                    model=self.model,
+                    temperature=0.0,
+                    max_tokens=self.DECISION_MAX_TOKENS * len(chunk),
+                    response_format={"type": "json_object"}, # JSON mode requires a top-level object, not an array
+                )
+                content = chat_completion.choices[0].message.content
+                data = _json_loads(content)
+                items = data.get('decisions') if isinstance(data, dict) else None
+                if not isinstance(items, list) or len(items) != len(chunk) or not all(isinstance(d, dict) for d in items):
+                    raise ValueError(f"Expected {len(chunk)} decisions in batch reply")
+                    
+                for idx, summary, item in zip(chunk_idx, chunk, items):
+                    decision = self._normalize_decision(item)
+                    decision = self._validate_decision_against_context(decision, summary)
+                    self._cache_put(self._cache_key(summary, performance_context), decision)
+                    decisions[idx] = decision
+                    
+            except Exception as e:
+                # Misaligned or failed batch -> fall back to per-symbol calls for this chunk
+                print(f"Groq Batch Error ({len(chunk)} symbols): {e}. Falling back to single calls.")
+                for idx, summary in zip(chunk_idx, chunk):
+                    decisions[idx] = self.get_trade_decision(summary, performance_context)
+                
+        return decisions
 
     def get_narrative_intelligence(self, user_prompt: str) -> str:
         """
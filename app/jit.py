@@ -0,0 +1,35 @@
+"""
+Optional Numba acceleration.
+Kernels decorated with `njit` compile to machine code when Numba is installed
+and run as plain Python otherwise, so the bot never hard-depends on it.
+"""
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports both @njit and @njit(...))."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+def warm_up():
+    """
+    Compiles (or loads from the on-disk cache) every kernel once at startup, so the first
+    live tick doesn't pay for it. Each call uses the argument types of its live call site;
+    a different type would compile a second specialization mid-session.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    import numpy as np
+    from app import fast_ema, smc, risk_manager, execution_engine
+    
+    x = np.zeros(16)
+    fast_ema.ema_alpha(x, 0.5) # TALib._ewm_mean
+    fast_ema.rolling_mean_std(x, 20) # TALib.bbands
+    fast_ema.supertrend_kernel(x, x, x) # TALib.calculate_supertrend
+    smc._smc_scan(x, x, x, 5, 0, 0) # SMCEngine.calculate_smc
+    risk_manager._kelly_units(0.5, 1.0, 1.0, 10000.0, 2000.0, 1990.0, 0.01) # calculate_kelly_position
+    execution_engine._trail_kernel(1.0, 2000.0, 2000.0, 1990.0, 10.0, 0.5, 0.0, 0.0) # apply_trailing_stop
@@ -1,16 +1,67 @@
+import time
 import pandas as pd
+import numpy as np
 import MetaTrader5 as mt5
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from .ta_lib import TALib
 from .smc import SMCEngine
 from .news_harvester import NewsHarvester
 
+# (span, n) -> weight vector whose dot product with the last n closes equals the final
+# value of ewm(span, adjust=False): w = [(1-a)^(n-1), a(1-a)^(n-2), ..., a]
+_EWM_WEIGHTS = {}
+
+def _ewm_weights(span: int, n: int) -> np.ndarray:
+    w = _EWM_WEIGHTS.get((span, n))
+    if w is None:
+        alpha = 2.0 / (span + 1.0)
+        w = (1.0 - alpha) ** np.arange(n - 1, -1, -1, dtype=np.float64)
+        w[1:] *= alpha
+        _EWM_WEIGHTS[(span, n)] = w
+    return w
+
+def _tail_dict(df, cols):
+    """
+    Last-bar values of `cols` via positional .iat (no mixed-dtype row Series). Absent columns are skipped.
+    Float columns come back as Python floats (RSI/Stoch are stored as float32).
+    """
+    latest = {}
+    for c in cols:
+        if c in df.columns:
+            v = df[c].iat[-1]
+            latest[c] = float(v) if isinstance(v, np.floating) else v
+    return latest
+
+def _timeframe_seconds(timeframe):
+    """MT5 timeframe constant -> bar length in seconds (None for W1/MN1)."""
+    if timeframe < 0x4000:
+        return timeframe * 60 # M1..M30 encode minutes
+    if timeframe < 0x8000:
+        return (timeframe - 0x4000) * 3600 # H1..D1 encode hours in the low bits
+    return None
+
+# Multi-timeframe rate pulls are IPC-bound (the MT5 calls release the GIL) -> fan them out
+_POOL = ThreadPoolExecutor(max_workers=4)
+
+# (broker server, base symbol) -> resolved broker symbol, shared by every sensor in the process
+_SYMBOL_CACHE = {}
+
+# Indicator families computed by MarketSensor.calculate_indicators
+# trend: EMA 13/50/200 | mom: RSI, MACD, fast MACD | osc: Stochastic | vol: BB, ATR, Keltner, squeeze
+INDICATOR_GROUPS = ('trend', 'mom', 'osc', 'vol')
+
 class MarketSensor:
+    MARKET_DATA_TTL = 30 # Seconds a computed frame is reused within the same bar
+
     def __init__(self, symbol="EURUSD", timeframe=mt5.TIMEFRAME_M15):
         self.symbol = symbol
         self.timeframe = timeframe
         self.smc = SMCEngine() # Initialize SMC Engine
         self.news = NewsHarvester() # Initialize News Engine
+        self._ready = False # Set once initialize() has resolved/selected the symbol
+        # Summary, indicators and confluence all ask for the same candles each tick
+        self._md_cache = {'key': None, 'df': None, 'ts': 0.0, 'groups': frozenset()}
     
     def initialize(self) -> bool:
         """Initializes the MT5 connection and resolves specific symbol name."""
@@ -36,13 +87,35 @@ class MarketSensor:
             print(f"Failed to select symbol {self.symbol}")
             return False
                 
+        self._ready = True
         return True
 
+    def _is_connected(self) -> bool:
+        """True when the symbol is already set up and the terminal link is live."""
+        if not self._ready:
+            return False
+        info = mt5.terminal_info()
+        return info is not None and bool(info.connected)
+
     def _resolve_symbol(self, base_symbol: str) -> str:
         """
         Attempts to find the broker-specific symbol name.
         Example: 'XAUUSD' -> 'XAUUSDm', 'Gold', etc.
+        Results are cached per (broker server, base symbol) for the process.
         """
+        account = mt5.account_info()
+        cache_key = (getattr(account, 'server', None), base_symbol)
+        cached = _SYMBOL_CACHE.get(cache_key)
+        if cached is not None and mt5.symbol_info(cached) is not None:
+            return cached
+            
+        resolved = self._lookup_symbol(base_symbol)
+        if resolved:
+            _SYMBOL_CACHE[cache_key] = resolved
+        return resolved
+
+    @staticmethod
+    def _lookup_symbol(base_symbol: str) -> str:
         # 1. Try exact match
         info = mt5.symbol_info(base_symbol)
         if info is not None:
@@ -55,11 +128,11 @@ class MarketSensor:
             if mt5.symbol_info(trial) is not None:
                 return trial
                 
-        # 3. Search by partial match (Expensive but robust)
-        # Returns all symbols containing the base_name
-        all_symbols = mt5.symbols_get()
-        if all_symbols:
-            for s in all_symbols:
+        # 3. Search by partial match
+        # Terminal-side wildcard filter instead of pulling the whole symbol list (1000+)
+        candidates = mt5.symbols_get(group=f"*{base_symbol}*")
+        if candidates:
+            for s in candidates:
                 if base_symbol in s.name:
                     # Heuristic: return the first visible one, or just the first match
                     # Ideally we want the one that is 'tradable'
@@ -67,14 +140,37 @@ class MarketSensor:
         
         return None
 
-    def get_market_data(self, n_candles: int = 500) -> pd.DataFrame:
+    def get_market_data(self, n_candles: int = 500, groups=INDICATOR_GROUPS) -> pd.DataFrame:
         """
         Fetches n_candles from MT5, calculates indicators.
         Returns DataFrame with 'time', 'close', 'RSI_14', 'EMA_50', etc.
+        Only the requested indicator `groups` are guaranteed to be present.
+        """
+        # Own copy: callers add columns and bfill in place
+        return self._market_frame(n_candles, groups).copy()
+
+    def _market_frame(self, n_candles: int = 500, groups=INDICATOR_GROUPS) -> pd.DataFrame:
         """
-        if not self.initialize():
+        get_market_data without the defensive copy. The frame may be the cached one:
+        internal readers (latest row, SMC scan) must treat it as read-only.
+        """
+        if not self._is_connected() and not self.initialize():
             raise ConnectionError("Could not connect to MT5 or find symbol.")
 
+        # Same bar + fresh enough -> reuse the last computed frame
+        key = None
+        tf_seconds = _timeframe_seconds(self.timeframe)
+        tick = mt5.symbol_info_tick(self.symbol)
+        if tf_seconds and tick is not None:
+            key = (self.symbol, self.timeframe, n_candles, tick.time // tf_seconds)
+            if key == self._md_cache['key'] and (time.time() - self._md_cache['ts']) < self.MARKET_DATA_TTL:
+                # Top up only the families this caller needs that are not cached yet
+                missing = [g for g in groups if g not in self._md_cache['groups']]
+                if missing:
+                    self.calculate_indicators(self._md_cache['df'], missing)
+                    self._md_cache['groups'] = self._md_cache['groups'].union(missing)
+                return self._md_cache['df']
+
         # Copy rates from MT5
         rates = mt5.copy_rates_from_pos(self.symbol, self.timeframe, 0, n_candles)
         
@@ -86,8 +182,10 @@ class MarketSensor:
         df['time'] = pd.to_datetime(df['time'], unit='s')
         
         # Calculate Indicators (Custom)
-        df = self.calculate_indicators(df)
+        df = self.calculate_indicators(df, groups)
         
+        if key is not None:
+            self._md_cache = {'key': key, 'df': df, 'ts': time.time(), 'groups': frozenset(groups)}
         return df
         
     def fetch_mtf_data(self, n_candles: int = 500) -> dict:
@@ -95,7 +193,7 @@ class MarketSensor:
         Fetches M15, H1, and H4 data for the Matrix Analysis.
         Returns: {'M15': df, 'H1': df, 'H4': df}
         """
-        if not self.initialize():
+        if not self._is_connected() and not self.initialize():
             raise ConnectionError("MT5 Init Failed")
             
         # Helper to fetch and clean
@@ -107,27 +205,35 @@ class MarketSensor:
             df.dropna(inplace=True)
             return df
             
-        return {
-            'BASE': _fetch(self.timeframe),         # BASE (M15)
-            'HTF1': _fetch(mt5.TIMEFRAME_H4),       # HTF1 (H4)
-            'HTF2': _fetch(mt5.TIMEFRAME_D1)        # HTF2 (D1)
+        futures = {
+            'BASE': _POOL.submit(_fetch, self.timeframe),     # BASE (M15)
+            'HTF1': _POOL.submit(_fetch, mt5.TIMEFRAME_H4),   # HTF1 (H4)
+            'HTF2': _POOL.submit(_fetch, mt5.TIMEFRAME_D1)    # HTF2 (D1)
         }
+        return {k: f.result() for k, f in futures.items()}
 
-    def calculate_indicators(self, df):
+    def calculate_indicators(self, df, groups=INDICATOR_GROUPS):
         """
         Adds Technical Indicators to the DF using custom TA lib.
+        `groups` selects which families to compute (see INDICATOR_GROUPS).
         """
+        for group in groups:
+            getattr(self, f"_{group}_indicators")(df)
+        return df
+
+    @staticmethod
+    def _trend_indicators(df):
         # 1. Trend
         df['EMA_13'] = TALib.ema(df['close'], 13)
         df['EMA_50'] = TALib.ema(df['close'], 50)
         df['EMA_200'] = TALib.ema(df['close'], 200)
-        
+
+    @staticmethod
+    def _mom_indicators(df):
         # 2. Momentum
-        df['RSI_14'] = TALib.rsi(df['close'], 14)
-        
-        stoch = TALib.stoch(df)
-        df['STOCHk'] = stoch['STOCHk']
-        df['STOCHd'] = stoch['STOCHd']
+        # Bounded 0-100 oscillators are stored as float32 (half the footprint, ~1e-5 abs error).
+        # Price-scale columns stay float64: strategies compare them against raw prices.
+        df['RSI_14'] = TALib.rsi(df['close'], 14).astype(np.float32)
         
         macd = TALib.macd(df['close'])
         df['MACD'] = macd['MACD']
@@ -139,7 +245,15 @@ class MarketSensor:
         macd_fast = TALib.macd(df['close'], fast=6, slow=13, signal=4)
         df['MACD_Fast'] = macd_fast['MACD']
         df['MACDs_Fast'] = macd_fast['MACDs']
-        
+
+    @staticmethod
+    def _osc_indicators(df):
+        stoch = TALib.stoch(df)
+        df['STOCHk'] = stoch['STOCHk'].astype(np.float32)
+        df['STOCHd'] = stoch['STOCHd'].astype(np.float32)
+
+    @staticmethod
+    def _vol_indicators(df):
         # 3. Volatility
         bb = TALib.bbands(df['close'])
         df['BB_Upper'] = bb['BBU']
@@ -155,17 +269,13 @@ class MarketSensor:
         # Squeeze is ON when Bollinger Bands are completely inside Keltner Channels
         df['squeeze_on'] = (df['BB_Lower'] > df['KC_Lower']) & (df['BB_Upper'] < df['KC_Upper'])
 
-        
-        return df
-
     def get_trend_data(self, timeframe, n_candles=200):
         """Helper to get simple trend state for a timeframe."""
         rates = mt5.copy_rates_from_pos(self.symbol, timeframe, 0, n_candles)
         if rates is None or len(rates) == 0:
             return "Unknown"
         
-        df = pd.DataFrame(rates)
-        close = df['close']
+        close = np.asarray(rates['close'], dtype=np.float64)
         
         # EMA Settings Logic
         if timeframe == mt5.TIMEFRAME_M15:
@@ -177,9 +287,10 @@ class MarketSensor:
             fast_ema_period = 50
             slow_ema_period = 200
 
-        ema_fast = close.ewm(span=fast_ema_period, adjust=False).mean().iloc[-1]
-        ema_slow = close.ewm(span=slow_ema_period, adjust=False).mean().iloc[-1]
-        current = close.iloc[-1]
+        # Only the latest EMA value is needed -> one dot product each, no full series
+        ema_fast = _ewm_weights(fast_ema_period, len(close)) @ close
+        ema_slow = _ewm_weights(slow_ema_period, len(close)) @ close
+        current = close[-1]
         
         # Strict Alignment Logic
         status = "Ranging"
@@ -202,39 +313,47 @@ class MarketSensor:
         
         return f"{status} {debug_suffix}"
 
+    @staticmethod
+    def _last_confirmed_fractals(df):
+        """
+        (high of the last up fractal, low of the last down fractal), None where absent.
+        The last 2 bars are excluded: a fractal needs i+1 and i+2 to confirm, so the
+        latest confirmable one is at index -3 or earlier.
+        """
+        pos_up = np.flatnonzero(df['fractal_high'].to_numpy(dtype=bool)[:-2])
+        pos_down = np.flatnonzero(df['fractal_low'].to_numpy(dtype=bool)[:-2])
+        res_level = float(df['high'].iat[pos_up[-1]]) if pos_up.size else None
+        sup_level = float(df['low'].iat[pos_down[-1]]) if pos_down.size else None
+        return res_level, sup_level
+
     def get_fractal_structure(self, df):
         """
         Analyzes the last known Fractals to determine Market Structure.
         Replaces Candlestick Patterns with Geometric Breakouts.
         Returns: { 'signal': 'BREAK_UP'|'BREAK_DOWN'|'SWEEP_UP'|'SWEEP_DOWN'|'NONE', 'level': float }
         """
-        # 1. Identify Fractals
-        df = TALib.identify_fractals(df)
-        latest = df.iloc[-1]
-        current_close = latest['close']
+        # 1. Identify Fractals (reuse columns if the caller already computed them)
+        if 'fractal_high' not in df.columns:
+            df = TALib.identify_fractals(df)
+        close = df['close'].to_numpy()
+        current_close = close[-1]
         
         # Find the most recent VALID Confirm Fractals (ignoring the last 2 bars which can't be fractals yet)
-        # We slice [:-2] to be safe as fractal needs 2 future bars to confirm.
-        valid_history = df.iloc[:-2]
-        
-        last_up_fractal = valid_history[valid_history['fractal_high']].iloc[-1] if any(valid_history['fractal_high']) else None
-        last_down_fractal = valid_history[valid_history['fractal_low']].iloc[-1] if any(valid_history['fractal_low']) else None
+        res_level, sup_level = self._last_confirmed_fractals(df)
         
         signal = "NONE"
         level = 0.0
         
         # CHECK BREAKOUTS (Trend Mode)
         # Price CLOSES above the last Fractal High -> Bullish Breakout
-        if last_up_fractal is not None:
-            res_level = last_up_fractal['high']
-            if current_close > res_level and df.iloc[-2]['close'] <= res_level: # Fresh Break
+        if res_level is not None:
+            if current_close > res_level and close[-2] <= res_level: # Fresh Break
                 signal = "BREAK_UP"
                 level = res_level
 
         # Price CLOSES below the last Fractal Low -> Bearish Breakout
-        if last_down_fractal is not None:
-             sup_level = last_down_fractal['low']
-             if current_close < sup_level and df.iloc[-2]['close'] >= sup_level: # Fresh Break
+        if sup_level is not None:
+             if current_close < sup_level and close[-2] >= sup_level: # Fresh Break
                  signal = "BREAK_DOWN"
                  level = sup_level
                  
@@ -255,30 +374,9 @@ class MarketSensor:
         if 'fractal_high' not in df.columns:
             df = TALib.identify_fractals(df)
             
-        # Valid History (Excluding last 2 bars which are unconfirmed)
-        # Note: indentify_fractals uses forward shifting, so the boolean is effectively 'confirmed' 
-        # relative to the future, but in realtime simulation we only know it 2 bars later.
-        # But 'fractal_high' column is aligned to the *candle that is the high*.
-        # So we just search the past.
-        
-        # We need to make sure we don't peek into the future if this was backtesting, 
-        # but in live mode 'df' is history.
-        
-        # Latest Confirmable Fractal is at index -3 or earlier.
-        # Because we need i+1 and i+2 to confirm i.
-        valid_range = df.iloc[:-2] 
-        
-        last_resistance = 0.0
-        last_support = 0.0
-        
-        # Search backwards
-        up_fractals = valid_range[valid_range['fractal_high']]
-        if not up_fractals.empty:
-            last_resistance = up_fractals.iloc[-1]['high']
-            
-        down_fractals = valid_range[valid_range['fractal_low']]
-        if not down_fractals.empty:
-            last_support = down_fractals.iloc[-1]['low']
+        res_level, sup_level = self._last_confirmed_fractals(df)
+        last_resistance = res_level if res_level is not None else 0.0
+        last_support = sup_level if sup_level is not None else 0.0
             
         return {'resistance': last_resistance, 'support': last_support}
 
@@ -296,8 +394,9 @@ class MarketSensor:
         Returns: Tuple (bool, str) -> (is_confluent, reason)
         """
         try:
-            df = self.get_market_data()
-            latest = df.iloc[-1]
+            # EMA/MACD/RSI only: no Stochastic or band windows needed here
+            df = self._market_frame(groups=('trend', 'mom'))
+            latest = _tail_dict(df, ('close', 'EMA_50', 'EMA_200', 'MACD', 'MACDs', 'RSI_14'))
             
             # Extract Values
             close = latest['close']
@@ -352,12 +451,11 @@ class MarketSensor:
         Includes Trend, SMC Structure, Indicators, and FUNDAMENTALS.
         """
         # We need the full dataframe for SMC
-        df = self.get_market_data(n_candles=500)
+        # Indicators already come back from get_market_data (no second TALib pass)
+        df = self._market_frame(n_candles=500)
         if df is None or df.empty: return "Market Data Unavailable"
         
-        # Calculate Indicators 
-        df = TALib.calculate_indicators(df) 
-        latest = df.iloc[-1]
+        latest = _tail_dict(df, ('close', 'EMA_50', 'EMA_200', 'RSI_14', 'ATR_14', 'MACD', 'MACDs', 'STOCHk', 'STOCHd'))
         
         # --- SMC ANALYSIS ---
         smc_data = self.smc.calculate_smc(df)
@@ -401,13 +499,15 @@ FUNDAMENTAL CONTEXT:
         Used for dashboard visualization.
         """
         try:
-            df = self.get_market_data()
-            latest = df.iloc[-1]
+            # Dashboard shows no Stochastic
+            df = self._market_frame(groups=('trend', 'mom', 'vol'))
+            latest = _tail_dict(df, ('close', 'RSI_14', 'EMA_50', 'EMA_200', 'ATR_14', 'BB_Upper', 'BB_Lower',
+                                     'MACD', 'MACDs', 'MACD_Fast', 'MACDs_Fast', 'time'))
             
-            # Fetch Macro Trends
-            trend_d1 = self.get_trend_data(mt5.TIMEFRAME_D1)
-            trend_h4 = self.get_trend_data(mt5.TIMEFRAME_H4)
-            trend_m15 = self.get_trend_data(mt5.TIMEFRAME_M15)
+            # Fetch Macro Trends (concurrently)
+            trend_futures = [_POOL.submit(self.get_trend_data, tf)
+                             for tf in (mt5.TIMEFRAME_D1, mt5.TIMEFRAME_H4, mt5.TIMEFRAME_M15)]
+            trend_d1, trend_h4, trend_m15 = (f.result() for f in trend_futures)
             
             # Fetch Spread
             symbol_info = mt5.symbol_info(self.symbol)
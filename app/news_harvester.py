@@ -1,12 +1,21 @@
-import urllib.request
-import urllib.error
 import re
+import os
 from datetime import datetime
 import json
 
-import ssl
+import asyncio
+import httpx
+from app.async_io import run_async, submit
+
+# Start of the calendar's `days` array inside the page's JS state blob
+_CAL_RE = re.compile(r'window\.calendarComponentStates\[\d+\]\s*=\s*\{\s*"?days"?\s*:\s*(?=\[)')
+_JSON_DECODER = json.JSONDecoder()
+# Fallback scanner: every field of interest in one pass per event chunk (key order independent)
+_FIELD_RE = re.compile(r'"(name|currency|impactTitle|timeLabel|forecast|previous|actual|date)":"([^"]*)"')
 
 class NewsHarvester:
+    REFRESH_INTERVAL = 300 # Seconds between background calendar refreshes
+
     def __init__(self):
         self.url = "https://www.forexfactory.com/calendar"
         self.headers = {
@@ -19,55 +28,71 @@ class NewsHarvester:
             'Sec-Fetch-Dest': 'document',
             'Sec-Fetch-Mode': 'navigate',
             'Sec-Fetch-Site': 'cross-site',
-            'Sec-Fetch-User': '?1'
+            'Sec-Fetch-User': '?1',
+            'Accept-Encoding': 'gzip, deflate'
         }
+        # Async client on the shared I/O loop (created there on first fetch): one pooled TLS connection
+        self.client = None
+        # Validators from the last 200 -> conditional GET returns a tiny 304 when unchanged
+        self._etag = None
+        self._last_modified = None
         self.cache = []
         self.last_fetch = None
         self.disabled = False
         self.error_count = 0
+        self._refresher = None # Future of the background refresh loop (started on first use)
 
-    def _get_ssl_context(self):
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-        return ctx
-
-    def fetch_upcoming_news(self):
+    async def _fetch_events_async(self):
         """
-        Fetches High Impact news for USD and EUR.
-        Returns a formatted string for the AI or a list of dicts.
+        Downloads and parses the calendar. On 304 Not Modified the previous parse is reused.
+        Awaitable directly, so a caller on the I/O loop can gather it with other network calls.
         """
-        if self.disabled:
-             return "News Analysis Disabled (Source Blocked)."
-             
-        # Simple caching (15 mins) to avoid spamming FF
-        if self.last_fetch and (datetime.now() - self.last_fetch).seconds < 900:
-            return self._format_news(self.cache)
+        if self.client is None:
+            self.client = httpx.AsyncClient(headers=self.headers, verify=False, timeout=10.0, follow_redirects=True)
+
+        headers = {}
+        if self._etag:
+            headers['If-None-Match'] = self._etag
+        if self._last_modified:
+            headers['If-Modified-Since'] = self._last_modified
+
+        response = await self.client.get(self.url, headers=headers)
+        if response.status_code == 304:
+            return self.cache
+        response.raise_for_status()
+
+        html = response.text
+        self._etag = response.headers.get('ETag')
+        self._last_modified = response.headers.get('Last-Modified')
+
+        # Debug file only on success (opt-in: the page is several MB)
+        if os.getenv("DEBUG_NEWS") == "1":
+            with open("debug_calendar.html", "w", encoding="utf-8") as f:
+                f.write(html)
+
+        self.cache = self._parse_html(html)
+        return self.cache
 
+    async def _refresh_async(self):
+        """
+        One calendar refresh. Swaps in the new event list (self.cache is replaced, never
+        mutated, so readers on other threads always see a complete list) and tracks errors.
+        """
         try:
-            req = urllib.request.Request(self.url, headers=self.headers)
-            with urllib.request.urlopen(req, context=self._get_ssl_context()) as response:
-                html = response.read().decode('utf-8')
+            await self._fetch_events_async()
             
             # Reset error count if successful
             self.error_count = 0
-            
-            # Debug file only on success
-            # with open("debug_calendar.html", "w", encoding="utf-8") as f:
-            #     f.write(html)
-                
-            self.cache = self._parse_html(html)
             self.last_fetch = datetime.now()
-            return self._format_news(self.cache)
+            return
             
-        except urllib.error.HTTPError as e:
-            if e.code == 403:
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 403:
                 print(f"⚠️ News Feed Blocked (403). Disabling News Analysis for this session.")
                 self.disabled = True
-                return "News Disabled (Source Blocked)"
+                return
             else:
                  print(f"News Http Error: {e}")
-                 pass
         except Exception as e:
             print(f"News Scrape Error: {e}")
             
@@ -75,13 +100,76 @@ class NewsHarvester:
         if self.error_count > 5:
              print("⚠️ Too many News errors. Disabling News Module.")
              self.disabled = True
+
+    async def _refresh_loop(self):
+        while not self.disabled:
+            await asyncio.sleep(self.REFRESH_INTERVAL)
+            await self._refresh_async()
+
+    def _ensure_fresh(self):
+        """
+        First call fetches synchronously (so the first brief has news), then hands refreshing
+        to a background loop on the shared I/O loop. Later calls never touch the network.
+        """
+        if self._refresher is not None:
+            return
+        run_async(self._refresh_async())
+        if not self.disabled:
+            self._refresher = submit(self._refresh_loop())
+
+    def fetch_upcoming_news(self):
+        """
+        Fetches High Impact news for USD and EUR.
+        Returns a formatted string for the AI or a list of dicts.
+        Served from the background-refreshed cache (no I/O after the first call).
+        """
+        if self.disabled:
+             return "News Analysis Disabled (Source Blocked)."
              
-        return "News Data Unavailable (Checking Technicals Only)."
+        self._ensure_fresh()
+        if self.disabled:
+             return "News Disabled (Source Blocked)"
+        if self.last_fetch is None:
+             return "News Data Unavailable (Checking Technicals Only)."
+             
+        return self._format_news(self.cache)
 
     def _parse_html(self, html):
         """
-        Regex parser for ForexFactory Calendar (JS Object extraction).
-        Targeting 'window.calendarComponentStates' data structure.
+        Parser for ForexFactory Calendar (JS Object extraction).
+        Targeting 'window.calendarComponentStates' data structure: one regex locates the
+        `days` array and a single JSON decode reads every event. Falls back to the
+        chunk/regex scanner if the page layout changes.
+        """
+        match = _CAL_RE.search(html)
+        if match:
+            try:
+                days, _ = _JSON_DECODER.raw_decode(html, match.end())
+                news_items = []
+                for day in days:
+                    for ev in day.get('events', ()):
+                        currency = ev.get('currency')
+                        # Filter: EUR or USD, High Impact only
+                        if currency not in ('EUR', 'USD'): continue
+                        if "High Impact" not in ev.get('impactTitle', ''): continue
+                        
+                        news_items.append({
+                            'currency': currency,
+                            'event': ev.get('name', 'Unknown'),
+                            'time': f"{ev.get('date', '')} {ev.get('timeLabel', '')}",
+                            'forecast': ev.get('forecast', ''),
+                            'previous': ev.get('previous', ''),
+                            'actual': ev.get('actual', '')
+                        })
+                return news_items
+            except (ValueError, AttributeError, TypeError) as e:
+                print(f"Calendar JSON parse failed ({e}). Using regex fallback.")
+                
+        return self._parse_html_chunks(html)
+
+    def _parse_html_chunks(self, html):
+        """
+        Regex parser for ForexFactory Calendar (per-event chunk scan).
         """
         news_items = []
         
@@ -97,54 +185,29 @@ class NewsHarvester:
         
         for chunk in event_chunks[1:]: # Skip preamble
             try:
-                # 1. Extract Name
-                name_match = re.search(r'"name":"([^"]+)"', chunk)
-                event_name = name_match.group(1).encode('utf-8').decode('unicode_escape') if name_match else "Unknown"
-                
-                # 2. Extract Currency
-                curr_match = re.search(r'"currency":"([A-Z]{3})"', chunk)
-                if not curr_match: continue
-                currency = curr_match.group(1)
+                # First occurrence of each key wins (same as a per-key re.search)
+                fields = {}
+                for key, value in _FIELD_RE.findall(chunk):
+                    if key not in fields and (value or key not in ('name', 'date')):
+                        fields[key] = value
                 
                 # Filter: EUR or USD
+                currency = fields.get('currency', '')
                 if currency not in ['EUR', 'USD']: continue
                 
-                # 3. Extract Impact
                 # "impactTitle":"High Impact Expected"
-                impact_match = re.search(r'"impactTitle":"([^"]+)"', chunk)
-                impact_title = impact_match.group(1) if impact_match else ""
-                
-                if "High Impact" not in impact_title: continue
-                
-                # 4. Extract Time
-                # "timeLabel":"7:00am"
-                time_match = re.search(r'"timeLabel":"([^"]+)"', chunk)
-                time_label = time_match.group(1) if time_match else ""
-                
-                # 5. Extract Forecast
-                fcst_match = re.search(r'"forecast":"([^"]*)"', chunk)
-                forecast = fcst_match.group(1) if fcst_match else ""
+                if "High Impact" not in fields.get('impactTitle', ''): continue
                 
-                # 6. Previous
-                prev_match = re.search(r'"previous":"([^"]*)"', chunk)
-                previous = prev_match.group(1) if prev_match else ""
-
-                # 7. Actual (Critical for Phase 60)
-                act_match = re.search(r'"actual":"([^"]*)"', chunk)
-                actual = act_match.group(1) if act_match else ""
-                
-                # 8. Date (chunk belongs to a day, but date is "date":"Jan 22, 2026" inside ?)
-                # Actually, inside the event object, there is "date":"Jan 22, 2026"
-                date_match = re.search(r'"date":"([^"]+)"', chunk)
-                date_str = date_match.group(1) if date_match else ""
+                name = fields.get('name')
+                event_name = name.encode('utf-8').decode('unicode_escape') if name else "Unknown"
 
                 news_items.append({
                     'currency': currency,
                     'event': event_name,
-                    'time': f"{date_str} {time_label}",
-                    'forecast': forecast,
-                    'previous': previous,
-                    'actual': actual 
+                    'time': f"{fields.get('date', '')} {fields.get('timeLabel', '')}",
+                    'forecast': fields.get('forecast', ''),
+                    'previous': fields.get('previous', ''),
+                    'actual': fields.get('actual', '') # Critical for Phase 60
                 })
             except Exception as e:
                 # print(f"Chunk Error: {e}")
@@ -157,40 +220,20 @@ class NewsHarvester:
         Phase 60 Trigger.
         Checks if a High Impact event occurred in the last 15 minutes AND has an 'Actual' value.
         Returns the event dict if true, else None.
+        Reads the background-refreshed cache (at most REFRESH_INTERVAL old).
         """
         if self.disabled: return None
         
-        # Force fresh fetch
-        self.last_fetch = None 
+        self._ensure_fresh()
         
-        try:
-            req = urllib.request.Request(self.url, headers=self.headers)
-            with urllib.request.urlopen(req, context=self._get_ssl_context()) as response:
-                html = response.read().decode('utf-8')
-            all_events = self._parse_html(html)
-            self.error_count = 0 # Reset on success
-            
-            # Filter for events that HAVE an 'actual' value
-            finished_events = [e for e in all_events if e['actual'] != ""]
-            
-            if not finished_events:
-                return None
-                
-            occurred_event = finished_events[-1] 
-            return occurred_event
-            
-        except urllib.error.HTTPError as e:
-            if e.code == 403:
-                print(f"⚠️ News Trigger Blocked (403). Disabling News Analysis.")
-                self.disabled = True
-            return None
-        except Exception as e:
-            print(f"Trigger Check Error: {e}")
-            self.error_count += 1
-            if self.error_count > 5:
-                print("⚠️ Trigger Check unstable. Disabling News.")
-                self.disabled = True
+        # Filter for events that HAVE an 'actual' value
+        finished_events = [e for e in self.cache if e['actual'] != ""]
+        
+        if not finished_events:
             return None
+            
+        occurred_event = finished_events[-1] 
+        return occurred_event
 
 
     def _format_news(self, news_list):
@@ -12,6 +12,7 @@ class Oracle:
         self.ai = strategist
         self.last_brief = "System initializing..."
         self.last_update = None
+        self._last_state_key = None # Inputs behind last_brief; unchanged state -> no new LLM call
         
     def generate_brief(self, market_data: dict, regime: dict, leader_name: str, active_trades: list) -> str:
         """
@@ -23,6 +24,18 @@ class Oracle:
             if seconds_since < 900: # 15 minutes
                 return self.last_brief
                 
+        # Nothing moved since the last brief -> keep it and restart the 15 min window
+        close = market_data.get('close', 0)
+        state_key = (
+            regime.get('trend'),
+            leader_name,
+            len(active_trades),
+            round(close, 4) if isinstance(close, (int, float)) else close
+        )
+        if self.last_update and state_key == self._last_state_key:
+            self.last_update = datetime.now()
+            return self.last_brief
+                
         # 2. Construct Prompt
         context = f"""
         Market Regime: {regime.get('trend', 'UNKNOWN')} ({regime.get('summary', '')})
@@ -47,6 +60,7 @@ class Oracle:
             narrative = self.ai.get_narrative_intelligence(prompt)
             self.last_brief = narrative
             self.last_update = datetime.now()
+            self._last_state_key = state_key
             return narrative
             
         except Exception as e:
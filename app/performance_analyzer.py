@@ -1,10 +1,104 @@
-import pandas as pd
+import csv
+import json
 import os
 from app.config import Config
 
 class PerformanceAnalyzer:
     def __init__(self):
         self.log_file = os.path.join(Config.BASE_DIR, "trade_log.csv")
+        # Running totals + byte offset into the log, so each summary only parses newly appended rows
+        self.stats_file = os.path.join(Config.BASE_DIR, "trade_log_stats.json")
+        self._stats = self._load_stats()
+
+    @staticmethod
+    def _empty_stats() -> dict:
+        return {"offset": 0, "rows": 0, "total": 0, "wins": 0, "losses": 0, "net_pnl": 0.0, "recent": [],
+                "ident": None}
+
+    def _load_stats(self) -> dict:
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+            if set(stats) >= set(self._empty_stats()):
+                return stats
+        except (FileNotFoundError, ValueError):
+            pass
+        return self._empty_stats()
+
+    def _save_stats(self):
+        temp_file = self.stats_file + ".tmp"
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._stats, f)
+            os.replace(temp_file, self.stats_file)
+        except OSError as e:
+            print(f"Error writing performance stats: {e}")
+
+    def _refresh_stats(self) -> list:
+        """
+        Folds rows appended since the last call into the running totals.
+        Seeks past the bytes already counted; a shrunken or replaced log triggers a full rescan.
+        The log's identity (inode + header + first row) is kept with the totals, so a deleted and
+        recreated log is caught even after it grows past the stored offset.
+        Returns the CSV header.
+        """
+        st = os.stat(self.log_file)
+        size = st.st_size
+
+        with open(self.log_file, 'rb') as f:
+            header_line = f.readline()
+            header_end = f.tell()
+            first_row = f.readline()
+            if not first_row.endswith(b"\n"):
+                first_row = b"" # Still being written; identity settles once it is complete
+            ident = [st.st_ino, (header_line + first_row).decode('utf-8', errors='replace')]
+            if ident != self._stats["ident"] or size < self._stats["offset"]:
+                self._stats = self._empty_stats()
+                self._stats["ident"] = ident
+
+            header = next(csv.reader([header_line.decode('utf-8', errors='replace')]), [])
+            if self._stats["offset"] == 0:
+                self._stats["offset"] = header_end
+            if size <= self._stats["offset"]:
+                return header
+            f.seek(self._stats["offset"])
+            chunk = f.read(size - self._stats["offset"])
+
+        # Only consume complete lines; a row being written right now is picked up next time
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return header
+        self._stats["offset"] += end + 1
+
+        if "PnL" in header:
+            pnl_idx = header.index("PnL")
+            action_idx = header.index("Action") if "Action" in header else None
+            symbol_idx = header.index("Symbol") if "Symbol" in header else None
+            for row in csv.reader(chunk[:end + 1].decode('utf-8', errors='replace').splitlines()):
+                if not row:
+                    continue
+                self._stats["rows"] += 1
+                try:
+                    pnl = float(row[pnl_idx])
+                except (IndexError, ValueError):
+                    continue
+                # Closed Trades only (PnL != 0)
+                if pnl == 0:
+                    continue
+                self._stats["total"] += 1
+                if pnl > 0:
+                    self._stats["wins"] += 1
+                else:
+                    self._stats["losses"] += 1
+                self._stats["net_pnl"] += pnl
+                action = row[action_idx] if action_idx is not None and action_idx < len(row) else "?"
+                symbol = row[symbol_idx] if symbol_idx is not None and symbol_idx < len(row) else "?"
+                self._stats["recent"] = (self._stats["recent"] + [[action, symbol, pnl]])[-3:]
+        else:
+            self._stats["rows"] += sum(1 for line in chunk[:end + 1].splitlines() if line.strip())
+
+        self._save_stats()
+        return header
 
     def get_performance_summary(self) -> str:
         """
@@ -15,34 +109,29 @@ class PerformanceAnalyzer:
             return "No trading history available yet. This is your first session."
 
         try:
-            df = pd.read_csv(self.log_file)
-            if df.empty:
+            header = self._refresh_stats()
+            stats = self._stats
+            if stats["rows"] == 0:
                  return "No trading history available yet."
-            
+
             # Ensure PnL column exists
-            if "PnL" not in df.columns:
+            if "PnL" not in header:
                 return "Trading history exists but lacks PnL data."
 
-            # Filter for Closed Trades (PnL != 0)
-            closed_trades = df[df["PnL"] != 0].copy()
-            
-            if closed_trades.empty:
+            if stats["total"] == 0:
                 return "No closed trades yet. Only open positions or holds."
 
             # Calculate Stats
-            total_trades = len(closed_trades)
-            wins = len(closed_trades[closed_trades["PnL"] > 0])
-            losses = len(closed_trades[closed_trades["PnL"] < 0])
-            win_rate = (wins / total_trades) * 100
-            net_pnl = closed_trades["PnL"].sum()
-            
-            # Get Last 3 Trades for Recency Bias
-            last_3 = closed_trades.tail(3)
+            total_trades = stats["total"]
+            win_rate = (stats["wins"] / total_trades) * 100
+            net_pnl = stats["net_pnl"]
+
+            # Last 3 Trades for Recency Bias
             recent_context = []
-            for _, row in last_3.iterrows():
-                outcome = "WIN" if row['PnL'] > 0 else "LOSS"
-                recent_context.append(f"{outcome} ({row['Action']} on {row['Symbol']}, PnL: ${row['PnL']:.2f})")
-            
+            for action, symbol, pnl in stats["recent"]:
+                outcome = "WIN" if pnl > 0 else "LOSS"
+                recent_context.append(f"{outcome} ({action} on {symbol}, PnL: ${pnl:.2f})")
+
             recent_str = ", ".join(recent_context)
 
             summary = (
@@ -53,7 +142,7 @@ class PerformanceAnalyzer:
                 f"- Recent Outcomes: {recent_str}.\n"
                 f"Reflect on these results. If you are losing, be more conservative. If winning, maintain discipline."
             )
-            
+
             return summary
 
         except Exception as e:
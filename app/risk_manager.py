@@ -1,5 +1,48 @@
-
+import json
+import logging
+import os
+from bisect import bisect_left
+from datetime import date, datetime
+import numpy as np
 from app.config import Config
+from app.jit import njit
+
+# %-style calls: arguments are only formatted when the record passes the level filter
+logger = logging.getLogger("RISK_MANAGER")
+
+# int8 action codes for the vectorized validation path (validate_signals_batch)
+ACTION_HOLD = 0
+ACTION_BUY = 1
+ACTION_SELL = 2
+
+# Kelly sizing outcomes returned by _kelly_units
+KELLY_OK = 0
+KELLY_NO_DATA = 1 # Insufficient edge/data -> standard sizing
+KELLY_NO_EDGE = 2 # Negative Kelly -> half standard sizing
+KELLY_ZERO_RISK = 3 # Entry == SL -> minimum 0.01 units
+
+@njit(cache=True)
+def _kelly_units(win_rate, avg_win, avg_loss, equity, entry, sl, risk_per_trade):
+    """
+    Half-Kelly position size, capped at risk_per_trade.
+    Returns (status, kelly_fraction, kelly_risk_pct, units); units is only set for KELLY_OK.
+    """
+    if win_rate <= 0.5 or avg_loss == 0 or avg_win == 0:
+        return KELLY_NO_DATA, 0.0, 0.0, 0.0
+        
+    b = avg_win / avg_loss # Win/Loss ratio (e.g., 2.0 for 2R avg win vs 1R avg loss)
+    q = 1 - win_rate
+    kelly_fraction = (win_rate * b - q) / b
+    if kelly_fraction <= 0:
+        return KELLY_NO_EDGE, kelly_fraction, 0.0, 0.0
+        
+    # Half-Kelly (reduces variance), capped at Config RISK (Strict 1% Limit)
+    kelly_risk_pct = min(kelly_fraction * 0.5, risk_per_trade)
+    risk_per_unit = abs(entry - sl)
+    if risk_per_unit == 0:
+        return KELLY_ZERO_RISK, kelly_fraction, kelly_risk_pct, 0.01
+        
+    return KELLY_OK, kelly_fraction, kelly_risk_pct, (equity * kelly_risk_pct) / risk_per_unit
 
 class EquityCurveManager:
     """
@@ -7,6 +50,11 @@ class EquityCurveManager:
     Tracks Account Health, High Water Mark, and Drawdown.
     Determines if we are in 'Survival Mode' or 'Growth Mode'.
     """
+    # Drawdown % bands -> position-size multiplier (a band applies once DD is strictly above its threshold)
+    # <=5%: Standard/Growth 1.0 (ATH boost disabled for strict 1% limit) | >5%: Defensive 0.5 | >10%: Survival 0.25
+    RISK_SCALE_THRESHOLDS = (5.0, 10.0)
+    RISK_SCALE_FACTORS = (1.0, 0.50, 0.25)
+
     def __init__(self, initial_equity: float = 10000.0):
         self.state_file = "risk_state.json"
         
@@ -23,10 +71,10 @@ class EquityCurveManager:
             
         self.current_drawdown_pct = 0.0
         self.daily_drawdown_pct = 0.0
+        # Circuit-breaker limit in %, resolved once (checked every tick)
+        self._daily_loss_limit_pct = Config.MAX_DAILY_LOSS * 100.0
 
     def load_state(self) -> dict:
-        import json
-        import os
         if os.path.exists(self.state_file):
             try:
                 with open(self.state_file, 'r') as f:
@@ -36,20 +84,20 @@ class EquityCurveManager:
         return None
 
     def save_state(self):
-        import json
-        from datetime import datetime
         data = {
             'high_water_mark': self.high_water_mark,
             'start_of_day_equity': self.start_of_day_equity,
-            'date': self.last_date if self.last_date else datetime.now().date().isoformat()
+            'date': self.last_date if self.last_date else date.today().isoformat()
         }
         with open(self.state_file, 'w') as f:
             json.dump(data, f, indent=4)
         
     def update(self, current_equity: float, is_new_day: bool = False):
-        """Called every loop to update state."""
-        from datetime import datetime
-        today_str = datetime.now().date().isoformat()
+        """
+        Called every loop to update state.
+        O(1) per tick: HWM_t = max(HWM_t-1, E_t), DD_t = (HWM_t - E_t) / HWM_t.
+        """
+        today_str = date.today().isoformat()
         
         # Check against persisted date
         if self.last_date != today_str:
@@ -81,54 +129,36 @@ class EquityCurveManager:
             
     def sync_balance(self, equity: float):
         """Called on startup to sync internal state with Live Account."""
-        print(f"RiskManager: Syncing Start Equity to Live Balance: ${equity:.2f}")
-        from datetime import datetime
-        today_str = datetime.now().date().isoformat()
+        logger.info("RiskManager: Syncing Start Equity to Live Balance: $%.2f", equity)
+        today_str = date.today().isoformat()
         
         # Check Persistence
         if self.last_date == today_str:
             # SAME DAY RESTART: Keep start_of_day_equity from file!
             # If we crashed after losing 5%, start_of_day is HIGH, equity is LOW.
             # Daily Loss = HIGH - LOW = Correct Loss.
-            print(f"RiskManager: Same Day Restart. Daily Limit Preserved (Start Equity: ${self.start_of_day_equity:.2f})")
+            logger.info("RiskManager: Same Day Restart. Daily Limit Preserved (Start Equity: $%.2f)", self.start_of_day_equity)
         else:
             # NEW DAY RESTART: Reset Start Equity
             self.start_of_day_equity = equity
             self.last_date = today_str
-            print(f"RiskManager: New Day Detected. Resetting Daily Limit.")
-            
-        # Ensure HWM is at least current equity (but respect higher HWM from history)
-        if equity > self.high_water_mark:
-            self.high_water_mark = equity
+            logger.info("RiskManager: New Day Detected. Resetting Daily Limit.")
             
         self.save_state()
         
-        # Recalculate immediately
+        # Recalculate immediately (raises HWM to equity if higher, persisting it, and refreshes both drawdowns)
         self.update(equity)
 
     def get_risk_scale_factor(self, is_making_ath: bool = False) -> float:
         """
         Returns a multiplier for position size.
+        One binary search over RISK_SCALE_THRESHOLDS instead of an if/elif chain.
         """
-        # A. SURVIVAL MODE (Deep Drawdown > 10%)
-        if self.current_drawdown_pct > 10.0:
-            return 0.25 # Slash risk by 75%
-            
-        # B. DEFENSIVE MODE (Drawdown > 5%)
-        elif self.current_drawdown_pct > 5.0:
-            return 0.50 # Slash risk by 50%
-            
-        # C. GROWTH MODE (Making New Highs)
-        # If we are within 1% of HWM, consider it "ATH Zone"
-        elif self.current_drawdown_pct < 1.0:
-            return 1.0 # Boost risk DISABLED for Strict 1% Limit
-            
-        # D. STANDARD MODE
-        return 1.0
+        return self.RISK_SCALE_FACTORS[bisect_left(self.RISK_SCALE_THRESHOLDS, self.current_drawdown_pct)]
 
     def check_circuit_breaker(self) -> bool:
         """Returns True if Daily Loss Limit exceeded."""
-        if self.daily_drawdown_pct > (Config.MAX_DAILY_LOSS * 100):
+        if self.daily_drawdown_pct > self._daily_loss_limit_pct:
             return True
         return False
 
@@ -149,9 +179,8 @@ class IronCladRiskManager:
 
     def register_win(self):
         """Call this when a trade closes in profit."""
-        from datetime import datetime
         self.last_win_time = datetime.now()
-        print("✅ Win registered. Tracking for momentum analysis.")
+        logger.info("✅ Win registered. Tracking for momentum analysis.")
 
     def validate_signal(self, decision: dict) -> dict:
         """
@@ -162,19 +191,32 @@ class IronCladRiskManager:
         
         # 1. CIRCUIT BREAKER
         if self.equity_manager.check_circuit_breaker():
-            print("🚨 CIRCUIT BREAKER HIT: Max Daily Loss Exceeded. BLOCKING TRADES.")
+            logger.warning("🚨 CIRCUIT BREAKER HIT: Max Daily Loss Exceeded. BLOCKING TRADES.")
             decision['action'] = "HOLD"
             decision['reasoning_summary'] = f"🚨 DAILY LOSS LIMIT HIT ({self.equity_manager.daily_drawdown_pct:.2f}%). HALTED."
             return decision
 
         # 2. CONFIDENCE CHECK
         if confidence < self.min_confidence:
-            print(f"RiskManager: Confidence {confidence:.2f} < {self.min_confidence}. Overriding to HOLD.")
+            logger.debug("RiskManager: Confidence %.2f < %s. Overriding to HOLD.", confidence, self.min_confidence)
             decision['action'] = "HOLD"
             decision['reasoning_summary'] = f"[RISK OVERRIDE] Low confidence ({confidence:.2f}). Original: {decision.get('reasoning_summary')}"
             
         return decision
 
+    def validate_signals_batch(self, confidences: np.ndarray, actions: np.ndarray) -> np.ndarray:
+        """
+        Vectorized validate_signal for backtest/replay sweeps.
+        actions: int8 codes (ACTION_HOLD / ACTION_BUY / ACTION_SELL), one per signal.
+        Returns the filtered action codes: everything becomes HOLD while the circuit breaker
+        is tripped, and any signal below min_confidence is overridden to HOLD.
+        """
+        actions = np.asarray(actions, dtype=np.int8)
+        if self.equity_manager.check_circuit_breaker():
+            return np.full_like(actions, ACTION_HOLD)
+        keep = np.asarray(confidences, dtype=np.float64) >= self.min_confidence
+        return np.where(keep, actions, np.int8(ACTION_HOLD))
+
     def calculate_position_size(self, account_equity: float, entry_price: float, stop_loss_price: float) -> float:
         """
         Calculates position size in UNITS.
@@ -204,7 +246,7 @@ class IronCladRiskManager:
         position_size_units = risk_amount / distance
         
         if scale_factor != 1.0:
-            print(f"🛡️ Dynamic Risk Active: Factor {scale_factor}x. Risking {final_risk_pct*100:.2f}% (${risk_amount:.2f}).")
+            logger.info("🛡️ Dynamic Risk Active: Factor %sx. Risking %.2f%% ($%.2f).", scale_factor, final_risk_pct * 100, risk_amount)
         
         return position_size_units
 
@@ -239,7 +281,7 @@ class IronCladRiskManager:
                 
         return True
 
-    def calculate_kelly_position(self, win_rate: float, avg_win: float, avg_loss: float, equity: float, current_price: float, sl_price: float) -> float:
+    def calculate_kelly_position(self, win_rate: float, avg_win: float, avg_loss: float, equity: float, current_price: float, sl_price: float, verbose: bool = True) -> float:
         """
         PHASE 5B: Kelly Criterion for optimal position sizing
         Kelly Formula: f* = (p*b - q) / b
@@ -248,46 +290,40 @@ class IronCladRiskManager:
             b = win/loss ratio (avg_win / avg_loss)
             q = loss probability (1 - win_rate)
         
-        Uses Half-Kelly for conservative approach
+        Uses Half-Kelly for conservative approach.
+        The math lives in the _kelly_units kernel; backtests can pass verbose=False (or call it directly).
         """
         try:
+            status, kelly_fraction, kelly_risk_pct, units = _kelly_units(
+                float(win_rate), float(avg_win), float(avg_loss), float(equity),
+                float(current_price), float(sl_price), float(self.risk_per_trade)
+            )
+            
             # Fallback to standard method if insufficient data
-            if win_rate <= 0.5 or avg_loss == 0 or avg_win == 0:
-                print("📉 Kelly: Insufficient edge, using standard sizing")
+            if status == KELLY_NO_DATA:
+                if verbose:
+                    logger.debug("📉 Kelly: Insufficient edge, using standard sizing")
                 return self.calculate_position_size(equity, current_price, sl_price)
             
-            # Calculate Kelly criterion
-            b = avg_win / avg_loss  # Win/Loss ratio (e.g., 2.0 for 2R avg win vs 1R avg loss)
-            q = 1 - win_rate
-            kelly_fraction = (win_rate * b - q) / b
-            
-            # Sanity check - Kelly shouldn't be negative or > 0.25
-            if kelly_fraction <= 0:
-                print(f"📉 Kelly: No edge detected (fraction={kelly_fraction:.3f}), using min size")
+            # Sanity check - Kelly shouldn't be negative
+            if status == KELLY_NO_EDGE:
+                if verbose:
+                    logger.debug("📉 Kelly: No edge detected (fraction=%.3f), using min size", kelly_fraction)
                 return self.calculate_position_size(equity, current_price, sl_price) * 0.5
             
-            # Apply Half-Kelly (more conservative, reduces variance)
-            safe_kelly = kelly_fraction * 0.5
-            
-            # Cap at Config RISK (Strict 1% Limit)
-            kelly_risk_pct = min(safe_kelly, self.risk_per_trade)
-            
-            # Calculate position size using Kelly risk %
-            risk_amount = equity * kelly_risk_pct
-            risk_per_unit = abs(current_price - sl_price)
-            
-            if risk_per_unit == 0:
-                return 0.01
-            
-            units = risk_amount / risk_per_unit
+            if status == KELLY_ZERO_RISK:
+                return units
             
-            print(f"📊 Kelly Criterion: WR={win_rate:.1%}, B={b:.2f}, Kelly={kelly_fraction:.3f}, Half-Kelly={safe_kelly:.3f}")
-            print(f"💰 Kelly Position: {kelly_risk_pct:.2%} risk = {units:.2f} units (vs {self.risk_per_trade:.2%} standard)")
+            if verbose:
+                logger.debug("📊 Kelly Criterion: WR=%.1f%%, B=%.2f, Kelly=%.3f, Half-Kelly=%.3f",
+                             win_rate * 100, avg_win / avg_loss, kelly_fraction, kelly_fraction * 0.5)
+                logger.debug("💰 Kelly Position: %.2f%% risk = %.2f units (vs %.2f%% standard)",
+                             kelly_risk_pct * 100, units, self.risk_per_trade * 100)
             
             return units
             
         except Exception as e:
-            print(f"Kelly Calculation Error: {e}, falling back to standard sizing")
+            logger.error("Kelly Calculation Error: %s, falling back to standard sizing", e)
             return self.calculate_position_size(equity, current_price, sl_price)
 
     def validate_spread(self, spread_points: int, max_spread: int = 20) -> bool:
@@ -1,5 +1,98 @@
 import pandas as pd
-from app.ta_lib import TALib
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from app.jit import njit
+
+# FVG / order-block direction codes used by _smc_scan
+_BULL = 0
+_BEAR = 1
+
+@njit(cache=True)
+def _smc_scan(high, low, close, length, fvg_start, ob_start):
+    """
+    Fused SMC pass over raw arrays (what calculate_smc needs, nothing more):
+      - FVGs over bars [fvg_start, n-2): bullish if low[i+2] > high[i], bearish if low[i] > high[i+2];
+        the gap is attributed to the middle candle i+1.
+      - Swing high/low (bar equals the max/min of its centered 2*length+1 window) for OB candidates.
+      - Order blocks over bars [ob_start, n-5): a swing low (high) followed within 5 bars by a
+        same-direction FVG. Mitigated once a later close (from i+5, excluding the live bar)
+        breaks below its low (above its high), via one suffix min/max sweep.
+    Returns (fvg_pos, fvg_dir, ob_idx, ob_dir, ob_mit), all in scan order
+    (bullish before bearish per bar).
+    """
+    n = high.shape[0]
+    
+    # 1. FVGs (+ per-candle flags for the displacement check)
+    size = 2 * (n - 2 - fvg_start) if n - 2 > fvg_start else 0
+    fvg_pos = np.empty(size, np.int64)
+    fvg_dir = np.empty(size, np.int8)
+    bull_fvg_at = np.zeros(n, np.bool_)
+    bear_fvg_at = np.zeros(n, np.bool_)
+    n_fvg = 0
+    for i in range(fvg_start, n - 2):
+        if low[i + 2] > high[i]:
+            fvg_pos[n_fvg] = i + 1
+            fvg_dir[n_fvg] = _BULL
+            bull_fvg_at[i + 1] = True
+            n_fvg += 1
+        if low[i] > high[i + 2]:
+            fvg_pos[n_fvg] = i + 1
+            fvg_dir[n_fvg] = _BEAR
+            bear_fvg_at[i + 1] = True
+            n_fvg += 1
+            
+    # 2. Suffix min/max of closes[j:n-1] for the mitigation check
+    fut_min = np.empty(n, np.float64)
+    fut_max = np.empty(n, np.float64)
+    lo = np.inf
+    hi = -np.inf
+    for j in range(n - 2, -1, -1):
+        lo = min(lo, close[j])
+        hi = max(hi, close[j])
+        fut_min[j] = lo
+        fut_max[j] = hi
+        
+    # 3. Swings + order blocks
+    stop = n - 5
+    size = 2 * (stop - ob_start) if stop > ob_start else 0
+    ob_idx = np.empty(size, np.int64)
+    ob_dir = np.empty(size, np.int8)
+    ob_mit = np.empty(size, np.bool_)
+    n_ob = 0
+    for i in range(ob_start, stop):
+        if i < length or i + length >= n:
+            continue
+        w_max = high[i - length]
+        w_min = low[i - length]
+        for j in range(i - length + 1, i + length + 1):
+            w_max = max(w_max, high[j])
+            w_min = min(w_min, low[j])
+            
+        for direction in (_BULL, _BEAR):
+            if direction == _BULL and low[i] != w_min:
+                continue
+            if direction == _BEAR and high[i] != w_max:
+                continue
+                
+            # Validation: displacement FVG shortly after the swing (bars i+1 .. i+5)
+            fvg_at = bull_fvg_at if direction == _BULL else bear_fvg_at
+            if not fvg_at[i + 1:i + 6].any():
+                continue
+                
+            # Mitigation: only a CLOSE through the zone invalidates it (O(1) suffix lookup)
+            mitigated = False
+            if i + 5 < n - 1:
+                if direction == _BULL:
+                    mitigated = fut_min[i + 5] < low[i]
+                else:
+                    mitigated = fut_max[i + 5] > high[i]
+                    
+            ob_idx[n_ob] = i
+            ob_dir[n_ob] = direction
+            ob_mit[n_ob] = mitigated
+            n_ob += 1
+            
+    return fvg_pos[:n_fvg], fvg_dir[:n_fvg], ob_idx[:n_ob], ob_dir[:n_ob], ob_mit[:n_ob]
 
 class SMCEngine:
     """
@@ -15,18 +108,22 @@ class SMCEngine:
         Returns the dataframe with 'is_swing_high' and 'is_swing_low' columns.
         """
         df = df.copy()
-        df.loc[:, 'is_swing_high'] = False
-        df.loc[:, 'is_swing_low'] = False
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        is_high = np.zeros(len(df), dtype=bool)
+        is_low = np.zeros(len(df), dtype=bool)
         
-        for i in range(length, len(df) - length):
-            # Swing High
-            if df['high'].iloc[i] == df['high'].iloc[i-length:i+length+1].max():
-                df.at[df.index[i], 'is_swing_high'] = True
-                
-            # Swing Low
-            if df['low'].iloc[i] == df['low'].iloc[i-length:i+length+1].min():
-                df.at[df.index[i], 'is_swing_low'] = True
-                
+        # Centered window of 2*length+1 bars; the first/last `length` bars can't be swings
+        win = 2 * length + 1
+        if len(df) >= win:
+            center = slice(length, len(df) - length)
+            # Swing High: bar equals the max of its window
+            is_high[center] = high[center] == sliding_window_view(high, win).max(axis=1)
+            # Swing Low: bar equals the min of its window
+            is_low[center] = low[center] == sliding_window_view(low, win).min(axis=1)
+            
+        df['is_swing_high'] = is_high
+        df['is_swing_low'] = is_low
         return df
 
     def detect_fvgs(self, df: pd.DataFrame) -> list:
@@ -36,31 +133,34 @@ class SMCEngine:
         """
         fvgs = []
         # Scan last 50 candles
-        for i in range(len(df) - 50, len(df) - 2): # Need i, i+1, i+2
-            # Bullish FVG: (High of i) < (Low of i+2)
-            # Candle i+1 is the displacement candle
-            candle_1_high = df.iloc[i]['high']
-            candle_3_low = df.iloc[i+2]['low']
-            
-            if candle_3_low > candle_1_high:
+        start = max(0, len(df) - 50)
+        high = df['high'].to_numpy()[start:]
+        low = df['low'].to_numpy()[start:]
+        
+        # Candle i+1 is the displacement candle (compare i with i+2)
+        # Bullish FVG: (High of i) < (Low of i+2)
+        bull = low[2:] > high[:-2]
+        # Bearish FVG: (Low of i) > (High of i+2)
+        bear = low[:-2] > high[2:]
+        
+        # Only the (few) gap candles are turned into dicts
+        times = df['time']
+        for j in np.flatnonzero(bull | bear):
+            i = start + j
+            if bull[j]:
                 fvgs.append({
                     "type": "BULLISH_FVG",
-                    "top": candle_3_low,
-                    "bottom": candle_1_high,
-                    "time": str(df.iloc[i+1]['time']),
+                    "top": low[j + 2],
+                    "bottom": high[j],
+                    "time": str(times.iat[i + 1]),
                     "index": i+1 # The FVG is formed by the middle candle
                 })
-                
-            # Bearish FVG: (Low of i) > (High of i+2)
-            candle_1_low = df.iloc[i]['low']
-            candle_3_high = df.iloc[i+2]['high']
-            
-            if candle_1_low > candle_3_high:
+            if bear[j]:
                 fvgs.append({
                     "type": "BEARISH_FVG",
-                    "top": candle_1_low,
-                    "bottom": candle_3_high,
-                    "time": str(df.iloc[i+1]['time']),
+                    "top": low[j],
+                    "bottom": high[j + 2],
+                    "time": str(times.iat[i + 1]),
                     "index": i+1
                 })
                 
@@ -108,63 +208,36 @@ class SMCEngine:
         if df is None or len(df) < 50:
             return {"order_blocks": [], "fvgs": [], "structure": "Unknown"}
 
-        # ensure ATR exists
-        if 'ATR_14' not in df.columns:
-            df['ATR_14'] = TALib.atr(df, 14)
-
-        df = self.detect_swings(df)
-        
-        # 1. Detect all FVGs first
-        all_fvgs = self.detect_fvgs(df)
+        # No ATR injection: the OB scan doesn't use it, and the caller's frame stays untouched.
+        # One fused pass on raw arrays (no detect_swings copy of the frame).
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
         
-        order_blocks = []
+        # FVGs: last 50 candles. Order Blocks: last 100 candles, -5 buffer for validation.
+        fvg_pos, fvg_dir, ob_idx, ob_dir, ob_mit = _smc_scan(
+            high, low, close, 5, max(0, len(df) - 50), max(0, len(df) - 100)
+        )
         
-        # Scan for Order Blocks (Last 100 candles only for performance)
-        lookback = 100
-        start_idx = max(0, len(df) - lookback)
+        times = df['time']
+        order_blocks = [{
+            "type": "BULLISH_OB" if d == _BULL else "BEARISH_OB",
+            "price_top": high[i], # Refinement: Top of Swing Candle
+            "price_bottom": low[i],
+            "time": str(times.iat[i]),
+            "index": int(i),
+            "mitigated": bool(m)
+        } for i, d, m in zip(ob_idx, ob_dir, ob_mit)]
         
-        for i in range(start_idx, len(df) - 5): # -5 buffer for validation
-            
-            # Bullish OB Candidate (Swing Low)
-            if df.iloc[i]['is_swing_low']:
-                # Validation: Must create Bullish FVG shortly after
-                if self.check_displacement_with_fvg(df, i, "UP", all_fvgs):
-                    ob = {
-                        "type": "BULLISH_OB",
-                        "price_top": df.iloc[i]['high'], # Refinement: Top of Swing Candle
-                        "price_bottom": df.iloc[i]['low'],
-                        "time": str(df.iloc[i]['time']),
-                        "index": i,
-                        "mitigated": False
-                    }
-                    # Check Mitigation (VALIDITY CHECK)
-                    # FIX: Only invalidate if Price CLOSES below the OB (Broken Support)
-                    # Simply touching it (mitigation) is actually the entry trigger, so we keep it alive.
-                    future_closes = df['close'].iloc[i+5:-1]
-                    if not future_closes.empty and future_closes.min() < ob['price_bottom']:
-                        ob['mitigated'] = True
-                    
-                    order_blocks.append(ob)
-
-            # Bearish OB Candidate (Swing High)
-            if df.iloc[i]['is_swing_high']:
-                # Validation: Must create Bearish FVG shortly after
-                if self.check_displacement_with_fvg(df, i, "DOWN", all_fvgs):
-                    ob = {
-                        "type": "BEARISH_OB",
-                        "price_top": df.iloc[i]['high'],
-                        "price_bottom": df.iloc[i]['low'],
-                        "time": str(df.iloc[i]['time']),
-                        "index": i,
-                        "mitigated": False
-                    }
-                    # Check Mitigation (VALIDITY CHECK)
-                    # FIX: Only invalidate if Price CLOSES above the OB (Broken Resistance)
-                    future_closes = df['close'].iloc[i+5:-1]
-                    if not future_closes.empty and future_closes.max() > ob['price_top']:
-                        ob['mitigated'] = True
-                        
-                    order_blocks.append(ob)
+        # Only the last 5 FVGs are reported -> only those become dicts
+        recent_fvgs = [{
+            "type": "BULLISH_FVG" if d == _BULL else "BEARISH_FVG",
+            # Bull: gap between candle-1 high and candle-3 low; Bear: candle-1 low and candle-3 high
+            "top": low[k + 1] if d == _BULL else low[k - 1],
+            "bottom": high[k - 1] if d == _BULL else high[k + 1],
+            "time": str(times.iat[k]),
+            "index": int(k)
+        } for k, d in zip(fvg_pos[-5:], fvg_dir[-5:])]
         
         # Filter for only Fresh (Unmitigated) OBs
         fresh_obs = [ob for ob in order_blocks if not ob['mitigated']]
@@ -174,6 +247,6 @@ class SMCEngine:
         
         return {
             "order_blocks": fresh_obs[:3], # Return top 3 freshest
-            "fvgs": all_fvgs[-5:], # Return last 5 FVGs context
+            "fvgs": recent_fvgs, # Return last 5 FVGs context
             "structure": "Trend Following"
         }
@@ -1,5 +1,13 @@
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from .fast_ema import ema_alpha, rolling_mean_std, supertrend_kernel, NUMBA_AVAILABLE
+
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
 
 class TALib:
     """
@@ -11,7 +19,7 @@ class TALib:
     def calculate_indicators(df: pd.DataFrame) -> pd.DataFrame:
         """
         Calculates all standard indicators used by the Strategy.
-        Mutates dataframe or returns new one with columns:
+        Returns a new dataframe (the input is not modified) with columns:
         RSI_14, EMA_50, EMA_200, ATR_14, BB_Upper, BB_Lower, 
         MACD, MACDs, MACDh, STOCHk, STOCHd.
         """
@@ -19,36 +27,40 @@ class TALib:
         if df is None or len(df) < 200:
             return df
 
-        # RSI
-        df['RSI_14'] = TALib.rsi(df['close'], 14)
-        
-        # EMAs
-        df['EMA_50'] = TALib.ema(df['close'], 50)
-        df['EMA_200'] = TALib.ema(df['close'], 200)
-        
-        # ATR
-        df['ATR_14'] = TALib.atr(df, 14)
-        
-        # Bollinger Bands
-        bb = TALib.bbands(df['close'])
-        df['BB_Upper'] = bb['BBU']
-        df['BB_Lower'] = bb['BBL']
-        
-        # MACD
-        macd = TALib.macd(df['close'])
-        df['MACD'] = macd['MACD']
-        df['MACDs'] = macd['MACDs']
-        df['MACDh'] = macd['MACDh']
-        
-        # Stochastic
+        close = df['close']
+        bb = TALib.bbands(close)
+        macd = TALib.macd(close)
         stoch = TALib.stoch(df)
-        df['STOCHk'] = stoch['STOCHk']
-        df['STOCHd'] = stoch['STOCHd']
         
-        # Clean up NaNs created by indicators (optional, but good for safety)
-        df.bfill(inplace=True)
+        # Collect every column first and attach them in one concat
+        # (one allocation instead of a block insert per assignment)
+        out = {
+            'RSI_14': TALib.rsi(close, 14),
+            'EMA_50': TALib.ema(close, 50),
+            'EMA_200': TALib.ema(close, 200),
+            'ATR_14': TALib.atr(df, 14),
+            'BB_Upper': bb['BBU'],
+            'BB_Lower': bb['BBL'],
+            'MACD': macd['MACD'],
+            'MACDs': macd['MACDs'],
+            'MACDh': macd['MACDh'],
+            'STOCHk': stoch['STOCHk'],
+            'STOCHd': stoch['STOCHd'],
+        }
+        indicators = pd.DataFrame(out, index=df.index)
+        
+        # Clean up warm-up NaNs created by indicators; only the indicator block needs the scan
+        indicators = indicators.bfill()
         
-        return df
+        return pd.concat([df.drop(columns=list(out), errors='ignore'), indicators], axis=1)
+
+    @staticmethod
+    def _ewm_mean(series: pd.Series, alpha: float) -> pd.Series:
+        """ewm(alpha=alpha, adjust=False).mean(), via the Numba kernel when available."""
+        if NUMBA_AVAILABLE and not series.hasnans:
+            return pd.Series(ema_alpha(series.to_numpy(dtype=np.float64), alpha), index=series.index)
+        # NaN gaps follow pandas' reweighting rules -> let pandas handle them
+        return series.ewm(alpha=alpha, adjust=False).mean()
 
     @staticmethod
     def rsi(series: pd.Series, length: int = 14) -> pd.Series:
@@ -59,43 +71,56 @@ class TALib:
         # Use exponential moving average for wilder's RSI if preferred, 
         # but simple rolling is robust enough for this context.
         # Let's match standard Wilder's RSI usually:
-        gain = (delta.where(delta > 0, 0)).ewm(alpha=1/length, adjust=False).mean()
-        loss = (-delta.where(delta < 0, 0)).ewm(alpha=1/length, adjust=False).mean()
+        gain = TALib._ewm_mean(delta.where(delta > 0, 0), 1 / length)
+        loss = TALib._ewm_mean(-delta.where(delta < 0, 0), 1 / length)
         
         rs = gain / loss
         return 100 - (100 / (1 + rs))
 
     @staticmethod
     def ema(series: pd.Series, length: int) -> pd.Series:
-        return series.ewm(span=length, adjust=False).mean()
+        return TALib._ewm_mean(series, 2 / (length + 1))
 
     @staticmethod
     def atr(df: pd.DataFrame, length: int = 14) -> pd.Series:
-        high = df['high']
-        low = df['low']
-        close = df['close']
-        prev_close = close.shift(1)
-        
-        tr1 = high - low
-        tr2 = (high - prev_close).abs()
-        tr3 = (low - prev_close).abs()
-        
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+        prev_close = np.empty_like(close)
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
+        
+        # True Range in one pass over raw arrays. fmax skips the NaN on the first bar
+        # (no previous close), exactly like the old concat(...).max(axis=1).
+        tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
         # return tr.rolling(window=length).mean() # SMMA/RMA typically used, but simple rolling or ewm ok.
         # Better to use EWM for ATR to match standard
-        return tr.ewm(alpha=1/length, adjust=False).mean()
+        return TALib._ewm_mean(pd.Series(tr, index=df.index), 1 / length)
 
     @staticmethod
     def bbands(series: pd.Series, length: int = 20, std: int = 2) -> pd.DataFrame:
-        ma = series.rolling(window=length).mean()
-        std_dev = series.rolling(window=length).std()
+        if TALIB_AVAILABLE and not series.hasnans:
+            # TA-Lib's STDDEV is the population std (ddof=0); rescale the band width so the
+            # result matches the sample std (ddof=1) used below
+            width = std * np.sqrt(length / (length - 1))
+            upper, ma, lower = talib.BBANDS(series.to_numpy(dtype=np.float64), timeperiod=length,
+                                            nbdevup=width, nbdevdn=width, matype=0)
+            return pd.DataFrame({'BBM': ma, 'BBU': upper, 'BBL': lower}, index=series.index)
+        if NUMBA_AVAILABLE and not series.hasnans:
+            # One fused running-sum pass for both the SMA and the std
+            ma_np, std_np = rolling_mean_std(series.to_numpy(dtype=np.float64), length)
+            ma = pd.Series(ma_np, index=series.index)
+            std_dev = pd.Series(std_np, index=series.index)
+        else:
+            ma = series.rolling(window=length).mean()
+            std_dev = series.rolling(window=length).std()
         upper = ma + (std_dev * std)
         lower = ma - (std_dev * std)
         return pd.DataFrame({'BBM': ma, 'BBU': upper, 'BBL': lower})
 
     @staticmethod
     def keltner_channels(df: pd.DataFrame, length: int = 20, mult: float = 1.5) -> pd.DataFrame:
-        kc_middle = df['close'].ewm(span=length, adjust=False).mean()
+        kc_middle = TALib.ema(df['close'], length)
         atr = TALib.atr(df, length)
         kc_upper = kc_middle + (atr * mult)
         kc_lower = kc_middle - (atr * mult)
@@ -103,24 +128,29 @@ class TALib:
 
     @staticmethod
     def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> pd.DataFrame:
-        ema_fast = series.ewm(span=fast, adjust=False).mean()
-        ema_slow = series.ewm(span=slow, adjust=False).mean()
+        ema_fast = TALib.ema(series, fast)
+        ema_slow = TALib.ema(series, slow)
         macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+        signal_line = TALib.ema(macd_line, signal)
         hist = macd_line - signal_line
         return pd.DataFrame({'MACD': macd_line, 'MACDs': signal_line, 'MACDh': hist})
 
     @staticmethod
     def stoch(df: pd.DataFrame, k: int = 14, d: int = 3, smooth_k: int = 3) -> pd.DataFrame:
         # Fast Stochastic
-        low_min = df['low'].rolling(window=k).min()
-        high_max = df['high'].rolling(window=k).max()
-        
-        # Avoid division by zero
+        if TALIB_AVAILABLE and not (df['low'].hasnans or df['high'].hasnans):
+            # Sliding MIN/MAX in C; same NaN warm-up as rolling(k)
+            low_min = talib.MIN(df['low'].to_numpy(dtype=np.float64), timeperiod=k)
+            high_max = talib.MAX(df['high'].to_numpy(dtype=np.float64), timeperiod=k)
+        else:
+            low_min = df['low'].rolling(window=k).min().to_numpy()
+            high_max = df['high'].rolling(window=k).max().to_numpy()
+        
+        # Avoid division by zero (one ufunc pass on the raw array instead of Series.replace)
         denom = high_max - low_min
-        denom = denom.replace(0, 0.0001) 
+        denom = np.where(denom == 0, 0.0001, denom)
         
-        fast_k = 100 * (df['close'] - low_min) / denom
+        fast_k = pd.Series(100 * (df['close'].to_numpy(dtype=np.float64) - low_min) / denom, index=df.index)
         
         # Slow Stochastic (Smooth Fast K)
         stoch_k = fast_k.rolling(window=smooth_k).mean()
@@ -132,36 +162,33 @@ class TALib:
     def identify_fractals(df: pd.DataFrame) -> pd.DataFrame:
         """
         Bill Williams Fractals (5-bar pattern).
-        Returns df with 'fractal_high' and 'fractal_low' boolean columns.
-        Note: Fractal is confirmed 2 bars later.
+        Returns a new frame with 'fractal_high' and 'fractal_low' boolean columns
+        (the input frame is not modified). Note: Fractal is confirmed 2 bars later.
         """
         # We need 5 bars window. The "Fractal" is at the center (index i).
         # Shift -2 means we are looking at future bars relative to i, 
         # but in realtime we just check if i-2 was a fractal relative to i, i-1, i-3, i-4.
         
-        # Explicit copy to prevent SettingWithCopyWarning on slices
-        df = df.copy()
-        
-        # Vectorized implementation for speed
-        # Highs
-        h = df['high']
-        is_up = (h > h.shift(1)) & (h > h.shift(2)) & \
-                (h > h.shift(-1)) & (h > h.shift(-2))
-                
-        # Lows
-        l = df['low']
-        is_down = (l < l.shift(1)) & (l < l.shift(2)) & \
-                  (l < l.shift(-1)) & (l < l.shift(-2))
-                  
-        # Use .loc to avoid SettingWithCopyWarning
-        df.loc[:, 'fractal_high'] = is_up
-        df.loc[:, 'fractal_low'] = is_down
-        
-        # Fill NA (created by shift) with False
-        df.loc[:, 'fractal_high'] = df['fractal_high'].fillna(False)
-        df.loc[:, 'fractal_low'] = df['fractal_low'].fillna(False)
-        
-        return df
+        # Vectorized implementation for speed: one strided 5-bar view per side
+        # (no shifted copies). The center must be strictly beyond all four neighbours;
+        # NaN compares False, and the first/last 2 bars have no full window -> False.
+        is_up = np.zeros(len(df), dtype=bool)
+        is_down = np.zeros(len(df), dtype=bool)
+        if len(df) >= 5:
+            # Highs
+            hw = sliding_window_view(df['high'].to_numpy(dtype=np.float64), 5)
+            is_up[2:-2] = (hw[:, 2:3] > hw[:, [0, 1, 3, 4]]).all(axis=1)
+            
+            # Lows
+            lw = sliding_window_view(df['low'].to_numpy(dtype=np.float64), 5)
+            is_down[2:-2] = (lw[:, 2:3] < lw[:, [0, 1, 3, 4]]).all(axis=1)
+            
+        # Attach only the two new columns: concat without copy reuses the input's blocks,
+        # so callers' slices are neither copied in full nor written to
+        fractals = pd.DataFrame({'fractal_high': is_up, 'fractal_low': is_down}, index=df.index)
+        if 'fractal_high' in df.columns or 'fractal_low' in df.columns:
+            df = df.drop(columns=['fractal_high', 'fractal_low'], errors='ignore')
+        return pd.concat([df, fractals], axis=1, copy=False)
 
     @staticmethod
     def calculate_vwap(df: pd.DataFrame) -> float:
@@ -172,9 +199,17 @@ class TALib:
         if 'tick_volume' not in df.columns or len(df) < 1:
             return df['close'].iloc[-1] if len(df) > 0 else 0.0
         
-        typical_price = (df['high'] + df['low'] + df['close']) / 3
-        vwap = (typical_price * df['tick_volume']).cumsum() / df['tick_volume'].cumsum()
-        return vwap.iloc[-1]
+        # Only the last VWAP value is returned -> two sums on raw arrays instead of
+        # two full cumsums. nansum skips NaN rows like Series.cumsum did, but a NaN on the
+        # last bar still gives NaN.
+        typical_price = (df['high'].to_numpy(dtype=np.float64) + df['low'].to_numpy(dtype=np.float64)
+                         + df['close'].to_numpy(dtype=np.float64)) / 3
+        volume = df['tick_volume'].to_numpy(dtype=np.float64)
+        pv = typical_price * volume
+        if np.isnan(pv[-1]):
+            return np.nan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.nansum(pv) / np.nansum(volume)
     
     @staticmethod
     def calculate_supertrend(df: pd.DataFrame, period: int = 10, multiplier: float = 3.0) -> dict:
@@ -189,37 +224,24 @@ class TALib:
         # Calculate ATR
         atr = TALib.atr(df, period)
         
-        # Calculate basic upper and lower bands
-        hl_avg = (df['high'] + df['low']) / 2
+        # Calculate basic upper and lower bands (raw arrays for the state loop)
+        atr = atr.to_numpy(dtype=np.float64)
+        hl_avg = (df['high'].to_numpy(dtype=np.float64) + df['low'].to_numpy(dtype=np.float64)) / 2
         upper_band = hl_avg + (multiplier * atr)
         lower_band = hl_avg - (multiplier * atr)
         
-        # Initialize supertrend
-        supertrend = pd.Series(index=df.index, dtype=float)
-        trend = pd.Series(index=df.index, dtype=int)
+        # Each level depends on the previous one -> compiled loop instead of .iloc reads/writes
+        supertrend, trend = supertrend_kernel(df['close'].to_numpy(dtype=np.float64), upper_band, lower_band)
         
-        # First value
-        supertrend.iloc[0] = lower_band.iloc[0]
-        trend.iloc[0] = 1  # Assume uptrend initially
-        
-        for i in range(1, len(df)):
-            # Update bands based on previous supertrend
-            if df['close'].iloc[i] > supertrend.iloc[i-1]:
-                trend.iloc[i] = 1  # Uptrend
-                supertrend.iloc[i] = max(lower_band.iloc[i], supertrend.iloc[i-1])
-            else:
-                trend.iloc[i] = -1  # Downtrend
-                supertrend.iloc[i] = min(upper_band.iloc[i], supertrend.iloc[i-1])
-        
-        current_trend = 'UP' if trend.iloc[-1] == 1 else 'DOWN'
-        current_level = supertrend.iloc[-1]
+        current_trend = 'UP' if trend[-1] == 1 else 'DOWN'
+        current_level = supertrend[-1]
         
         # Generate signal (trend change)
         signal = 'HOLD'
         if len(trend) > 1:
-            if trend.iloc[-1] == 1 and trend.iloc[-2] == -1:
+            if trend[-1] == 1 and trend[-2] == -1:
                 signal = 'BUY'  # Trend flipped to up
-            elif trend.iloc[-1] == -1 and trend.iloc[-2] == 1:
+            elif trend[-1] == -1 and trend[-2] == 1:
                 signal = 'SELL'  # Trend flipped to down
         
         return {
@@ -240,22 +262,19 @@ class TALib:
             return 0.0
         
         # RVI formula: (Close - Open) / (High - Low)
-        # Smoothed with SMA
-        close_open = df['close'] - df['open']
-        high_low = df['high'] - df['low']
+        # Smoothed with SMA. Only the last window is returned, and the 1/period of
+        # both means cancels in the ratio -> two window sums over raw arrays
+        close_open = df['close'].to_numpy(dtype=np.float64)[-period:] - df['open'].to_numpy(dtype=np.float64)[-period:]
+        high_low = df['high'].to_numpy(dtype=np.float64)[-period:] - df['low'].to_numpy(dtype=np.float64)[-period:]
         
         # Avoid division by zero
-        high_low = high_low.replace(0, 0.0001)
-        
-        # Calculate numerator and denominator with SMA smoothing
-        num = close_open.rolling(window=period).mean()
-        denom = high_low.rolling(window=period).mean()
+        high_low = np.where(high_low == 0, 0.0001, high_low)
         
-        rvi = num / denom
+        # A NaN anywhere in the window gives NaN, like rolling(period) did
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rvi = np.clip(close_open.sum() / high_low.sum(), -1, 1)
         
-        rvi = rvi.clip(-1, 1)
-        
-        return rvi.iloc[-1] if not pd.isna(rvi.iloc[-1]) else 0.0
+        return float(rvi) if not np.isnan(rvi) else 0.0
 
     @staticmethod
     def calculate_volume_profile(df: pd.DataFrame, bins: int = 50) -> dict:
@@ -334,3 +353,91 @@ class TALib:
             'val': val,
             'hvns': hvns
         }
+
+
+def ema_step(prev_ema: float, new_value: float, alpha: float) -> float:
+    """One step of the EWM recurrence used by TALib (ewm(adjust=False)): ema_t = a*x_t + (1-a)*ema_{t-1}."""
+    return alpha * new_value + (1.0 - alpha) * prev_ema
+
+
+class StreamingTA:
+    """
+    O(1)-per-bar EMA/RSI/ATR/MACD for bars that arrive one at a time.
+    `seed` cold-starts a symbol from a history frame (same values as TALib on that frame);
+    `update` then folds in each new closed bar with the scalar EWM recurrences instead of
+    re-running the full-series pandas passes.
+    """
+    EMA_LENGTHS = (50, 200)
+    RSI_LENGTH = 14
+    ATR_LENGTH = 14
+    MACD_PARAMS = (12, 26, 9)
+
+    def __init__(self):
+        self.state = {}
+
+    def seed(self, symbol: str, df: pd.DataFrame) -> dict:
+        """Initializes `symbol` from a full OHLC frame. Returns the latest indicator values."""
+        close = df['close']
+        delta = close.diff()
+        fast, slow, signal = self.MACD_PARAMS
+        ema_fast = TALib.ema(close, fast)
+        ema_slow = TALib.ema(close, slow)
+        macd_line = ema_fast - ema_slow
+        state = {
+            'close': float(close.iat[-1]),
+            'rsi_gain': float(TALib._ewm_mean(delta.where(delta > 0, 0), 1 / self.RSI_LENGTH).iat[-1]),
+            'rsi_loss': float(TALib._ewm_mean(-delta.where(delta < 0, 0), 1 / self.RSI_LENGTH).iat[-1]),
+            'atr': float(TALib.atr(df, self.ATR_LENGTH).iat[-1]),
+            'macd_fast': float(ema_fast.iat[-1]),
+            'macd_slow': float(ema_slow.iat[-1]),
+            'macd_signal': float(TALib.ema(macd_line, signal).iat[-1]),
+        }
+        for length in self.EMA_LENGTHS:
+            state[f'ema_{length}'] = float(TALib.ema(close, length).iat[-1])
+        self.state[symbol] = state
+        return self.latest(symbol)
+
+    def update(self, symbol: str, bar: dict) -> dict:
+        """Folds one new closed bar ({'high', 'low', 'close'}) into `symbol`'s state."""
+        s = self.state[symbol]
+        high, low, close = float(bar['high']), float(bar['low']), float(bar['close'])
+        prev_close = s['close']
+        
+        for length in self.EMA_LENGTHS:
+            key = f'ema_{length}'
+            s[key] = ema_step(s[key], close, 2 / (length + 1))
+            
+        delta = close - prev_close
+        s['rsi_gain'] = ema_step(s['rsi_gain'], max(delta, 0.0), 1 / self.RSI_LENGTH)
+        s['rsi_loss'] = ema_step(s['rsi_loss'], max(-delta, 0.0), 1 / self.RSI_LENGTH)
+        
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        s['atr'] = ema_step(s['atr'], tr, 1 / self.ATR_LENGTH)
+        
+        fast, slow, signal = self.MACD_PARAMS
+        s['macd_fast'] = ema_step(s['macd_fast'], close, 2 / (fast + 1))
+        s['macd_slow'] = ema_step(s['macd_slow'], close, 2 / (slow + 1))
+        s['macd_signal'] = ema_step(s['macd_signal'], s['macd_fast'] - s['macd_slow'], 2 / (signal + 1))
+        
+        s['close'] = close
+        return self.latest(symbol)
+
+    def latest(self, symbol: str) -> dict:
+        """Current values under the same names as the calculate_indicators columns."""
+        s = self.state[symbol]
+        gain, loss = s['rsi_gain'], s['rsi_loss']
+        if loss == 0:
+            rsi = float('nan') if gain == 0 else 100.0
+        else:
+            rsi = 100 - (100 / (1 + gain / loss))
+        macd = s['macd_fast'] - s['macd_slow']
+        latest = {
+            'RSI_14': rsi,
+            'ATR_14': s['atr'],
+            'MACD': macd,
+            'MACDs': s['macd_signal'],
+            'MACDh': macd - s['macd_signal'],
+        }
+        for length in self.EMA_LENGTHS:
+            latest[f'EMA_{length}'] = s[f'ema_{length}']
+        return latest
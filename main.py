@@ -21,6 +21,7 @@ from app.chronos import ChronosWeaver, ChronosArena
 from app.oracle import Oracle
 from app.macro_sensor import MacroSensor # INSTITUTIONAL UPGRADE 1
 from app.ml_engine import MLEngine # INSTITUTIONAL UPGRADE 3
+from app.jit import warm_up
 
 def main():
     print("=== Hybrid Neuro-Symbolic Trading System Starting ===")
@@ -32,13 +33,16 @@ def main():
         print(f"CRITICAL: {e}")
         sys.exit(1)
         
+    # Numba kernels: compile/load before the first tick (no-op without Numba)
+    warm_up()
+        
     # 2. Initialize Components
     sensor = MarketSensor(symbol=Config.SYMBOL, timeframe=Config.TIMEFRAME)
     macro_sensor = MacroSensor() # Initialize MacroSensor
     ml_engine = MLEngine() # Initialize ML Engine
     from app.gamma_walls import GammaWallDetector
     gamma_detector = GammaWallDetector(danger_zone_dollars=5.0) # INSTITUTIONAL UPGRADE 4
-    ai_strategist = GroqStrategist(model="llama-3.3-70b-versatile")
+    ai_strategist = GroqStrategist(model=Config.GROQ_MODEL)
     risk_manager = IronCladRiskManager()
     executor = ExecutionEngine()
     dashboard = DashboardLogger()
@@ -0,0 +1,62 @@
+import os
+import sys
+import json
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.modules["MetaTrader5"] = MagicMock()
+
+import app.execution_engine as execution_engine
+from app.execution_engine import ExecutionEngine, MMAP_MIN_BYTES
+
+class TestTradeStatePersistence(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = ExecutionEngine.__new__(ExecutionEngine)
+        self.engine.trades_file = os.path.join(self.tmp.name, "trades.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_large_state_round_trip(self):
+        """Files above MMAP_MIN_BYTES take the mmap path and must load every trade."""
+        trades = [{"ticket": i, "action": "BUY", "open_price": 2000.0 + i, "sl": 1990.0, "tp": 2030.0,
+                   "volume": 0.01, "symbol": "XAUUSD", "comment": "x" * 64} for i in range(200)]
+        self.engine.save_state(trades)
+        self.assertGreater(os.path.getsize(self.engine.trades_file), MMAP_MIN_BYTES)
+        self.assertEqual(self.engine.load_state(), trades)
+
+    def test_corrupt_state_is_kept(self):
+        """An unparsable file is moved aside, not silently replaced by the next save."""
+        with open(self.engine.trades_file, 'w') as f:
+            f.write('[{"ticket": 1, ')
+        self.assertEqual(self.engine.load_state(), [])
+        with open(self.engine.trades_file + ".corrupt") as f:
+            self.assertEqual(f.read(), '[{"ticket": 1, ')
+        self.engine.save_state([{"ticket": 2}])
+        with open(self.engine.trades_file) as f:
+            self.assertEqual(json.load(f), [{"ticket": 2}])
+
+    def test_empty_state_is_no_trades(self):
+        """A zero-byte file is an empty book, not a corrupt one."""
+        open(self.engine.trades_file, 'w').close()
+        self.assertEqual(self.engine.load_state(), [])
+        self.assertTrue(os.path.exists(self.engine.trades_file))
+        self.assertFalse(os.path.exists(self.engine.trades_file + ".corrupt"))
+
+    def test_corrupt_state_that_cannot_be_moved(self):
+        """If the bad file can't be moved aside, saves are refused and no order is sent."""
+        with open(self.engine.trades_file, 'w') as f:
+            f.write('[{"ticket": 1, ')
+        with patch.object(execution_engine.os, 'replace', side_effect=PermissionError("locked")):
+            self.assertEqual(self.engine.load_state(), [])
+        self.engine.save_state([{"ticket": 2}])
+        with open(self.engine.trades_file) as f:
+            self.assertEqual(f.read(), '[{"ticket": 1, ')
+        with patch.object(execution_engine.mt5, 'order_send') as order_send:
+            self.assertIsNone(self.engine.execute_trade("BUY", 1990.0, 2030.0, 1.0, 2000.0))
+            order_send.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
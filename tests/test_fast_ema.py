@@ -0,0 +1,32 @@
+import unittest
+import numpy as np
+import pandas as pd
+from app.fast_ema import ema_span, ema_alpha, rolling_mean_std
+
+class TestFastEMA(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.close = pd.Series(2000 + rng.standard_normal(500).cumsum())
+
+    def test_span_matches_pandas(self):
+        """Kernel must reproduce ewm(span=k, adjust=False) exactly."""
+        for span in (13, 50, 200):
+            expected = self.close.ewm(span=span, adjust=False).mean().to_numpy()
+            np.testing.assert_allclose(ema_span(self.close.to_numpy(), span), expected, rtol=1e-12)
+
+    def test_alpha_matches_pandas(self):
+        """Wilder smoothing (RSI/ATR) uses alpha = 1/length."""
+        expected = self.close.ewm(alpha=1/14, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(ema_alpha(self.close.to_numpy(), 1/14), expected, rtol=1e-12)
+
+    def test_rolling_mean_std_matches_pandas(self):
+        """Bollinger inputs: SMA + sample std, NaN until the window fills."""
+        mean, std = rolling_mean_std(self.close.to_numpy(), 20)
+        np.testing.assert_allclose(mean, self.close.rolling(20).mean().to_numpy(), rtol=1e-12, equal_nan=True)
+        np.testing.assert_allclose(std, self.close.rolling(20).std().to_numpy(), rtol=1e-6, equal_nan=True)
+
+    def test_empty_input(self):
+        self.assertEqual(len(ema_span(np.empty(0), 10)), 0)
+
+if __name__ == '__main__':
+    unittest.main()
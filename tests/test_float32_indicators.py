@@ -0,0 +1,46 @@
+import sys
+import unittest
+from unittest.mock import MagicMock
+import numpy as np
+import pandas as pd
+
+sys.modules["MetaTrader5"] = MagicMock()
+
+from app.ta_lib import TALib
+from app.market_sensor import MarketSensor, _tail_dict
+
+class TestFloat32Indicators(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        close = 2000 + rng.standard_normal(2000).cumsum()
+        self.df = pd.DataFrame({
+            'high': close + rng.random(2000),
+            'low': close - rng.random(2000),
+            'close': close,
+        })
+
+    def test_downcast_error_within_tolerance(self):
+        """float32 RSI/Stoch must stay within 1e-4 * price of the float64 values."""
+        df = self.df.copy()
+        MarketSensor._mom_indicators(df)
+        MarketSensor._osc_indicators(df)
+        for col in ('RSI_14', 'STOCHk', 'STOCHd'):
+            self.assertEqual(df[col].dtype, np.float32, col)
+
+        stoch = TALib.stoch(self.df)
+        tolerance = 1e-4 * self.df['close'].to_numpy()
+        for col, exact in (('RSI_14', TALib.rsi(self.df['close'], 14)),
+                           ('STOCHk', stoch['STOCHk']), ('STOCHd', stoch['STOCHd'])):
+            err = np.abs(df[col].to_numpy(dtype=np.float64) - exact.to_numpy())
+            valid = ~np.isnan(err)
+            self.assertTrue(np.all(err[valid] < tolerance[valid]), col)
+
+    def test_tail_dict_returns_python_floats(self):
+        df = self.df.copy()
+        MarketSensor._mom_indicators(df)
+        latest = _tail_dict(df, ('close', 'RSI_14', 'MACD'))
+        for value in latest.values():
+            self.assertIs(type(value), float)
+
+if __name__ == '__main__':
+    unittest.main()
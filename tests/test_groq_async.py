@@ -0,0 +1,82 @@
+import asyncio
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+sys.modules["MetaTrader5"] = MagicMock()
+
+from app.config import Config
+import app.groq_strategist as gs
+
+class _FakeAsyncGroq:
+    """Stands in for AsyncGroq: fails like a loop-bound pool if used from another loop."""
+    def __init__(self, **kwargs):
+        self.loop = asyncio.get_running_loop()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        if asyncio.get_running_loop() is not self.loop:
+            raise RuntimeError("attached to a different loop")
+        await asyncio.sleep(0)
+        content = '{"action": "HOLD", "confidence_score": 0.5, "reasoning": "test"}'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+class TestAsyncDecisions(unittest.TestCase):
+    def setUp(self):
+        patches = [
+            patch.object(Config, 'GROQ_API_KEY', 'test-key'),
+            patch.object(Config, 'GROQ_WARMUP', False),
+            patch.object(gs, 'AsyncGroq', _FakeAsyncGroq),
+            patch.object(gs, '_ASYNC_CONCURRENCY', 1), # Force semaphore waits
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.strategist = gs.GroqStrategist(model="test-model")
+
+    def _run_batch(self, tag):
+        async def batch():
+            summaries = [f"[GATE 4 PASSED] {tag} {i}" for i in range(3)]
+            return await asyncio.gather(*(self.strategist.get_trade_decision_async(s) for s in summaries))
+        return asyncio.run(batch())
+
+    def test_separate_event_loops(self):
+        """Two asyncio.run() calls must each get a working client and semaphore."""
+        for tag in ("first", "second"):
+            decisions = self._run_batch(tag)
+            self.assertEqual(len(decisions), 3)
+            for decision in decisions:
+                self.assertNotEqual(decision.get("reasoning_summary"), "API Failure")
+
+class TestDecisionCache(unittest.TestCase):
+    def setUp(self):
+        patches = [
+            patch.object(Config, 'GROQ_API_KEY', 'test-key'),
+            patch.object(Config, 'GROQ_WARMUP', False),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.strategist = gs.GroqStrategist(model="test-model")
+        self.replies = ['{"action": "BUY", "confidence_sc', # Truncated at max_tokens
+                        '{"action": "HOLD", "confidence_score": 0.5, "reasoning": "ok"}']
+        self.calls = 0
+        def create(**kwargs):
+            content = self.replies[min(self.calls, len(self.replies) - 1)]
+            self.calls += 1
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+        self.strategist.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    def test_parse_error_is_not_cached(self):
+        """A truncated reply returns HOLD once; the next identical call asks the API again."""
+        summary = "[GATE 4 PASSED] cache"
+        first = self.strategist.get_trade_decision(summary)
+        self.assertTrue(first["reasoning_summary"].startswith(gs.GroqStrategist.PARSE_ERROR))
+        second = self.strategist.get_trade_decision(summary)
+        self.assertEqual(second["reasoning_summary"], "ok")
+        self.strategist.get_trade_decision(summary) # Valid reply is cached
+        self.assertEqual(self.calls, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.modules["MetaTrader5"] = MagicMock()
+
+from app.config import Config
+from app.performance_analyzer import PerformanceAnalyzer
+
+HEADER = "Time,Symbol,Action,PnL\n"
+
+class TestPerformanceStats(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base_dir = patch.object(Config, "BASE_DIR", self.tmp.name)
+        self.base_dir.start()
+        self.log_file = os.path.join(self.tmp.name, "trade_log.csv")
+
+    def tearDown(self):
+        self.base_dir.stop()
+        self.tmp.cleanup()
+
+    def _write_log(self, rows):
+        with open(self.log_file, 'w', encoding='utf-8') as f:
+            f.write(HEADER + "".join(rows))
+
+    def test_appended_rows_are_folded_in(self):
+        self._write_log(["t1,XAUUSD,BUY,10.0\n"])
+        analyzer = PerformanceAnalyzer()
+        analyzer.get_performance_summary()
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            f.write("t2,XAUUSD,SELL,-4.0\n")
+        analyzer.get_performance_summary()
+        self.assertEqual((analyzer._stats["total"], analyzer._stats["wins"]), (2, 1))
+        self.assertAlmostEqual(analyzer._stats["net_pnl"], 6.0)
+
+    def test_recreated_log_is_rescanned(self):
+        """A log deleted and recreated past the old offset must not inherit the stale totals."""
+        self._write_log(["t1,XAUUSD,BUY,10.0\n", "t2,XAUUSD,BUY,20.0\n"])
+        PerformanceAnalyzer().get_performance_summary()
+
+        os.remove(self.log_file)
+        self._write_log([f"n{i},EURUSD,SELL,-1.5\n" for i in range(10)])
+
+        # Fresh instance: only the sidecar survives, as after a restart
+        analyzer = PerformanceAnalyzer()
+        analyzer.get_performance_summary()
+        self.assertEqual((analyzer._stats["total"], analyzer._stats["losses"]), (10, 10))
+        self.assertAlmostEqual(analyzer._stats["net_pnl"], -15.0)
+        self.assertEqual(analyzer._stats["recent"][-1], ["SELL", "EURUSD", -1.5])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -59,5 +59,19 @@ class TestEquityCurve(unittest.TestCase):
         size = self.rm.calculate_position_size(10000.0, 1.0000, 0.9900)
         self.assertAlmostEqual(size, 15000.0)
 
+    def test_batch_validation_matches_scalar(self):
+        print("TEST: Batch Validation")
+        import numpy as np
+        from app.risk_manager import ACTION_HOLD, ACTION_BUY, ACTION_SELL
+        confidences = np.array([0.9, 0.5, 0.7, 0.69])
+        actions = np.array([ACTION_BUY, ACTION_SELL, ACTION_SELL, ACTION_BUY], dtype=np.int8)
+        out = self.rm.validate_signals_batch(confidences, actions)
+        self.assertEqual(out.tolist(), [ACTION_BUY, ACTION_HOLD, ACTION_SELL, ACTION_HOLD])
+        
+        # Circuit breaker blocks everything
+        self.rm.update_account_state(9400.0)
+        out = self.rm.validate_signals_batch(confidences, actions)
+        self.assertTrue((out == ACTION_HOLD).all())
+
 if __name__ == '__main__':
     unittest.main()
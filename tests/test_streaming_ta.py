@@ -0,0 +1,38 @@
+import unittest
+import numpy as np
+import pandas as pd
+from app.ta_lib import TALib, StreamingTA
+
+class TestStreamingTA(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        close = 2000 + rng.standard_normal(600).cumsum()
+        self.df = pd.DataFrame({
+            'high': close + rng.random(600),
+            'low': close - rng.random(600),
+            'close': close,
+        })
+
+    def test_updates_match_full_recalculation(self):
+        """Seeding on the first 400 bars and streaming the rest must land on the full-series values."""
+        ta = StreamingTA()
+        ta.seed('XAUUSD', self.df.iloc[:400])
+        for bar in self.df.iloc[400:].to_dict('records'):
+            latest = ta.update('XAUUSD', bar)
+
+        close = self.df['close']
+        macd = TALib.macd(close)
+        expected = {
+            'EMA_50': TALib.ema(close, 50).iat[-1],
+            'EMA_200': TALib.ema(close, 200).iat[-1],
+            'RSI_14': TALib.rsi(close, 14).iat[-1],
+            'ATR_14': TALib.atr(self.df, 14).iat[-1],
+            'MACD': macd['MACD'].iat[-1],
+            'MACDs': macd['MACDs'].iat[-1],
+            'MACDh': macd['MACDh'].iat[-1],
+        }
+        for key, value in expected.items():
+            self.assertAlmostEqual(latest[key], value, places=8, msg=key)
+
+if __name__ == '__main__':
+    unittest.main()